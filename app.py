@@ -16,7 +16,7 @@ from src.ui.confirmation_dialogs import show_delete_confirmation
 from src.ui.shared_components import render_sidebar
 from src.tools.recommend_tools import get_weekly_split_status
 from src.data import get_all_logs, get_logs_by_date_range
-from src.ui.styles import get_global_styles
+from src.ui.styles import inject_global_styles
 
 # CRITICAL: Import audio recorder here to initialize component for multipage app
 try:
@@ -68,7 +68,7 @@ render_bottom_nav('Home')
 # Apply Global Design System
 # ============================================================================
 
-st.markdown(get_global_styles(), unsafe_allow_html=True)
+inject_global_styles()
 
 # Additional home-specific styles
 st.markdown("""
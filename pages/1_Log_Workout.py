@@ -22,7 +22,7 @@ from src.ui.input_components import render_number_stepper
 from src.ui.timer_components import render_rest_timer
 from src.agents.log_graph import start_workout_log, continue_workout_log
 from src.tools.recommend_tools import suggest_next_workout, get_workout_template
-from src.ui.styles import get_global_styles
+from src.ui.styles import inject_global_styles
 
 # ============================================================================
 # Page Configuration
@@ -52,7 +52,7 @@ with st.sidebar:
     render_sidebar(current_page="Log")
 
 # Apply global design system styles
-st.markdown(get_global_styles(), unsafe_allow_html=True)
+inject_global_styles()
 
 # ============================================================================
 # State Machine Functions
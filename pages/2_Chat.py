@@ -12,7 +12,7 @@ import streamlit as st
 from src.ui.session import init_session_state, add_chat_message, clear_chat_history, get_orchestrator
 from src.ui.navigation import render_bottom_nav, scroll_to_top
 from src.ui.shared_components import render_sidebar
-from src.ui.styles import get_global_styles
+from src.ui.styles import inject_global_styles
 
 # ============================================================================
 # Page Configuration
@@ -35,7 +35,7 @@ st.session_state.current_page = 'Chat'
 render_bottom_nav('Chat')
 
 # Apply global design system styles
-st.markdown(get_global_styles(), unsafe_allow_html=True)
+inject_global_styles()
 
 # ============================================================================
 # Page Content
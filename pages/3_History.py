@@ -15,7 +15,7 @@ from src.ui.navigation import render_bottom_nav, scroll_to_top
 from src.ui.shared_components import render_sidebar
 from src.ui.confirmation_dialogs import show_delete_confirmation, show_bulk_delete_confirmation
 from src.data import get_all_logs, get_logs_by_date_range
-from src.ui.styles import get_global_styles
+from src.ui.styles import inject_global_styles
 
 # Page configuration
 st.set_page_config(
@@ -35,7 +35,7 @@ st.session_state.current_page = 'History'
 render_bottom_nav('History')
 
 # Apply global design system styles
-st.markdown(get_global_styles(), unsafe_allow_html=True)
+inject_global_styles()
 
 # Page-specific styles
 st.markdown("""
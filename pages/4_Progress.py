@@ -16,7 +16,7 @@ import streamlit as st
 from src.ui.session import init_session_state
 from src.ui.navigation import render_bottom_nav, scroll_to_top
 from src.ui.shared_components import render_sidebar, render_stat_card, render_empty_state
-from src.ui.styles import get_global_styles
+from src.ui.styles import inject_global_styles
 from src.ui.charts import (
     create_exercise_progression_chart,
     create_weekly_split_pie,
@@ -57,7 +57,7 @@ with st.sidebar:
     render_sidebar(current_page="Progress")
 
 # Apply global design system styles
-st.markdown(get_global_styles(), unsafe_allow_html=True)
+inject_global_styles()
 
 # ============================================================================
 # Page Content
@@ -0,0 +1,66 @@
+"""
+Build Catalog - Freeze data/exercise_catalog.json into a Python module.
+
+Writes src/agents/_catalog_data.py with the catalog as a Python literal
+(CATALOG), the name → exercise index (LOOKUP), the resolved beginner weight
+per exercise (RESOLVED) and the md5 of the JSON it came from (SOURCE_HASH).
+Importing it reuses the cached bytecode instead of parsing JSON and
+rebuilding the indexes. suggestion_engine only uses the module while
+SOURCE_HASH matches the JSON, so a stale build falls back to parsing.
+
+Rerun after editing data/exercise_catalog.json.
+
+Usage:
+    python scripts/build_catalog.py
+"""
+
+import json
+import pprint
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.agents.suggestion_engine import (  # noqa: E402
+    _CATALOG_PATH,
+    _index_catalog,
+    catalog_source_hash,
+)
+
+OUTPUT_PATH = ROOT / "src" / "agents" / "_catalog_data.py"
+
+HEADER = '''"""
+Exercise catalog, generated from data/exercise_catalog.json.
+
+Do not edit by hand - run `python scripts/build_catalog.py`.
+"""
+
+'''
+
+
+def main():
+    raw = Path(_CATALOG_PATH).read_bytes()
+    catalog = json.loads(raw)
+    exercises = catalog.get("exercises", [])
+
+    indexed = _index_catalog(json.loads(raw))
+    positions = {id(ex): i for i, ex in enumerate(indexed["exercises"])}
+    lookup = {name: positions[id(ex)] for name, ex in indexed["_lookup"].items()}
+
+    parts = [
+        HEADER,
+        f"SOURCE_HASH = {catalog_source_hash(raw)!r}\n\n",
+        f"CATALOG = {pprint.pformat(catalog, sort_dicts=False, width=100)}\n\n",
+        "# Lowercased canonical name or variation → index into CATALOG['exercises']\n",
+        f"LOOKUP = {pprint.pformat(lookup, sort_dicts=False, width=100)}\n\n",
+        "# Canonical name → (beginner weight lbs, reasoning)\n",
+        f"RESOLVED = {pprint.pformat(indexed['_resolved'], sort_dicts=False, width=100)}\n",
+    ]
+    OUTPUT_PATH.write_text("".join(parts), encoding="utf-8")
+
+    print(f"Wrote {OUTPUT_PATH.relative_to(ROOT)}: {len(exercises)} exercises, {len(lookup)} names")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Build CSS - Produce a minified, purged copy of the global stylesheet.
+
+Reads the stylesheet from src/ui/styles.py, removes rulesets whose class
+selectors are never referenced by the app's Python sources, tightens the
+whitespace, and splits the result into a design-token sheet (:root), a base
+sheet and one sheet per width breakpoint (@media ...width...). Browsers
+download sheets whose media query does not match at low priority without
+blocking render, so e.g. phones skip the desktop rules on first paint.
+
+Writes static/gym_bro.min.tokens.css, static/gym_bro.min.css (base rules),
+static/gym_bro.min.<n>.css (one per breakpoint, in first-appearance order so
+the cascade is preserved) and static/gym_bro.min.json, a manifest listing
+each sheet with its media query and content hash, plus the source hash.
+Per-sheet hashes mean an edit only busts the browser cache for the sheets
+it actually changes; the rarely edited tokens sheet usually stays cached.
+styles.py only serves the build while the source hash matches the current
+stylesheet, so a stale build falls back to the unpurged static/gym_bro.css
+(refreshed alongside).
+
+Usage:
+    python scripts/build_css.py
+"""
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.ui.styles import (  # noqa: E402
+    _GLOBAL_STYLES_MINIFIED,
+    _BUILT_CSS_MANIFEST_PATH,
+    _STATIC_CSS_PATH,
+    _stylesheet_hash,
+    _write_static_stylesheet,
+)
+
+OUTPUT_DIR = _STATIC_CSS_PATH.parent
+BASE_NAME = "gym_bro.min"
+
+# Sources scanned for class usage, including component frontends
+# (styles.py itself is excluded)
+SOURCE_GLOBS = ["app.py", "pages/*.py", "src/**/*.py", "src/**/*.html"]
+
+# Classes rendered by Streamlit itself, never by our own markup
+STREAMLIT_CLASSES = {"main", "block-container", "element-container"}
+
+CLASS_RE = re.compile(r"\.(-?[_a-zA-Z][\w-]*)")
+
+
+def load_source_text() -> str:
+    """Concatenate every app source file that may emit class names."""
+    parts = []
+    for pattern in SOURCE_GLOBS:
+        for path in sorted(ROOT.glob(pattern)):
+            if path.name == "styles.py":
+                continue
+            parts.append(path.read_text(encoding="utf-8"))
+    return "\n".join(parts)
+
+
+def is_streamlit_class(name: str) -> bool:
+    """True for classes owned by Streamlit (stButton, stNumberInput, ...)."""
+    return name in STREAMLIT_CLASSES or bool(re.match(r"st[A-Z]", name))
+
+
+def selector_is_used(selector: str, source_text: str) -> bool:
+    """A selector is used unless it names an app class absent from the sources."""
+    for name in CLASS_RE.findall(selector):
+        if is_streamlit_class(name):
+            continue
+        if not re.search(rf"(?<![\w-]){re.escape(name)}(?![\w-])", source_text):
+            return False
+    return True
+
+
+def split_blocks(css: str) -> list[tuple[str, str]]:
+    """
+    Split CSS into top-level (prelude, body) pairs.
+
+    Nested blocks (e.g. rules inside @media) are returned as raw body text
+    and handled recursively by purge().
+    """
+    blocks = []
+    depth = 0
+    start = 0
+    prelude = ""
+    for i, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude = css[start:i].strip()
+                start = i + 1
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[start:i].strip()))
+                start = i + 1
+    return blocks
+
+
+def purge(css: str, source_text: str) -> tuple[str, int]:
+    """
+    Drop unused selectors and rulesets.
+
+    Returns:
+        tuple: (purged CSS, number of rulesets removed)
+    """
+    out = []
+    removed = 0
+    for prelude, body in split_blocks(css):
+        if prelude.startswith("@"):
+            inner, inner_removed = purge(body, source_text)
+            removed += inner_removed
+            if inner:
+                out.append(f"{prelude}{{{inner}}}")
+            continue
+
+        selectors = [s.strip() for s in prelude.split(",")]
+        kept = [s for s in selectors if selector_is_used(s, source_text)]
+        if not kept:
+            removed += 1
+            continue
+        out.append(f"{','.join(kept)}{{{body}}}")
+    return "".join(out), removed
+
+
+def tighten(css: str) -> str:
+    """Remove whitespace the minifier in styles.py keeps for safety."""
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}")
+
+
+def split_sheets(css: str) -> tuple[str, str, dict[str, str]]:
+    """
+    Separate design tokens and width-based @media blocks from the rest.
+
+    Returns:
+        tuple: (tokens CSS, base CSS, {media query: rules}) with queries in
+        the order they first appear; repeated queries are merged in source order
+    """
+    tokens = []
+    base = []
+    by_query: dict[str, list[str]] = {}
+    for prelude, body in split_blocks(css):
+        if prelude == ":root":
+            tokens.append(f"{prelude}{{{body}}}")
+        elif prelude.startswith("@media") and "width" in prelude:
+            query = prelude[len("@media"):].strip()
+            by_query.setdefault(query, []).append(body)
+        else:
+            base.append(f"{prelude}{{{body}}}")
+    return "".join(tokens), "".join(base), {q: "".join(parts) for q, parts in by_query.items()}
+
+
+def content_hash(css: str) -> str:
+    """Short per-sheet hash, used as the ?v= cache-buster."""
+    return hashlib.md5(css.encode("utf-8")).hexdigest()[:8]
+
+
+def main():
+    source_text = load_source_text()
+    purged, removed = purge(_GLOBAL_STYLES_MINIFIED, source_text)
+    tokens, base, breakpoints = split_sheets(tighten(purged))
+
+    # Keep the unpurged fallback copy in step with the build
+    _write_static_stylesheet()
+
+    for old_sheet in OUTPUT_DIR.glob(f"{BASE_NAME}*.css"):
+        old_sheet.unlink()
+
+    # Tokens first so every later sheet can resolve var(--...)
+    outputs = [(f"{BASE_NAME}.tokens.css", "all", tokens), (f"{BASE_NAME}.css", "all", base)]
+    for i, (query, rules) in enumerate(breakpoints.items(), start=1):
+        outputs.append((f"{BASE_NAME}.{i}.css", query, rules))
+
+    sheets = []
+    for filename, media, css in outputs:
+        (OUTPUT_DIR / filename).write_text(css, encoding="utf-8")
+        sheets.append({"file": filename, "media": media, "v": content_hash(css)})
+
+    manifest = {"src": _stylesheet_hash(), "sheets": sheets}
+    _BUILT_CSS_MANIFEST_PATH.write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+    before = len(_GLOBAL_STYLES_MINIFIED.encode("utf-8"))
+    after = sum(len(css.encode("utf-8")) for _, _, css in outputs)
+    print(f"Removed {removed} unused rulesets")
+    print(f"{before:,} → {after:,} bytes ({100 - after * 100 // before}% smaller)")
+    for filename, media, css in outputs:
+        print(f"  {filename:<24} {len(css.encode('utf-8')):>6,} bytes  media={media}")
+    print(f"Wrote {_BUILT_CSS_MANIFEST_PATH.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,505 @@
+"""
+Exercise catalog, generated from data/exercise_catalog.json.
+
+Do not edit by hand - run `python scripts/build_catalog.py`.
+"""
+
+SOURCE_HASH = 'd51f72d926fff3eff38d5ffacd5c232a'
+
+CATALOG = {'exercises': [{'canonical': 'Dumbbell Bench Press',
+                'variations': ['DB Bench Press', 'DB Bench', 'Dumbbell Press'],
+                'muscle_groups': ['Chest', 'Triceps', 'Shoulders'],
+                'equipment': ['Dumbbells', 'Bench'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 20.0,
+                                    'per_hand': True,
+                                    'reasoning': 'Start with 20 lbs per hand - focus on controlled '
+                                                 'reps with proper form'}},
+               {'canonical': 'Barbell Bench Press',
+                'variations': ['BB Bench Press', 'Bench Press', 'Flat Bench'],
+                'muscle_groups': ['Chest', 'Triceps', 'Shoulders'],
+                'equipment': ['Barbell', 'Bench'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 45.0,
+                                    'per_hand': False,
+                                    'reasoning': 'Start with just the bar (45 lbs) - master the '
+                                                 'movement before adding plates'}},
+               {'canonical': 'Incline Dumbbell Press',
+                'variations': ['Incline DB Press', 'Incline Press'],
+                'muscle_groups': ['Upper Chest', 'Shoulders', 'Triceps'],
+                'equipment': ['Dumbbells', 'Incline Bench'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 20.0,
+                                    'per_hand': True,
+                                    'reasoning': '20 lbs per hand - incline is harder than flat, '
+                                                 'focus on upper chest contraction'}},
+               {'canonical': 'Overhead Press',
+                'variations': ['Military Press', 'Shoulder Press', 'OHP'],
+                'muscle_groups': ['Shoulders', 'Triceps'],
+                'equipment': ['Dumbbells'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 15.0,
+                                    'per_hand': True,
+                                    'reasoning': '15 lbs per hand - shoulders are delicate, '
+                                                 'prioritize strict form over weight'}},
+               {'canonical': 'Cable Fly',
+                'variations': ['Cable Flys', 'Cable Chest Fly'],
+                'muscle_groups': ['Chest'],
+                'equipment': ['Cable Machine'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 20.0,
+                                    'per_hand': False,
+                                    'reasoning': '20 lbs total - focus on the stretch and squeeze, '
+                                                 'not the weight'}},
+               {'canonical': 'Tricep Pushdown',
+                'variations': ['Cable Pushdown', 'Tricep Cable Pushdown'],
+                'muscle_groups': ['Triceps'],
+                'equipment': ['Cable Machine'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 30.0,
+                                    'per_hand': False,
+                                    'reasoning': '30 lbs - keep elbows tucked, full extension at '
+                                                 'bottom'}},
+               {'canonical': 'Tricep Extension',
+                'variations': ['Overhead Tricep Extension', 'Skull Crusher'],
+                'muscle_groups': ['Triceps'],
+                'equipment': ['Dumbbells'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 15.0,
+                                    'per_hand': True,
+                                    'reasoning': '15 lbs - protect elbows, controlled movement '
+                                                 'throughout'}},
+               {'canonical': 'Lateral Raise',
+                'variations': ['Side Raise', 'Dumbbell Lateral Raise', 'DB Lateral Raise'],
+                'muscle_groups': ['Shoulders'],
+                'equipment': ['Dumbbells'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 10.0,
+                                    'per_hand': True,
+                                    'reasoning': '10 lbs per hand - very light, focus on time '
+                                                 'under tension and shoulder burn'}},
+               {'canonical': 'Front Raise',
+                'variations': ['Dumbbell Front Raise', 'DB Front Raise'],
+                'muscle_groups': ['Shoulders'],
+                'equipment': ['Dumbbells'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 10.0,
+                                    'per_hand': True,
+                                    'reasoning': '10 lbs - keep core engaged, avoid swinging'}},
+               {'canonical': 'Push Ups',
+                'variations': ['Pushups', 'Push Up'],
+                'muscle_groups': ['Chest', 'Triceps', 'Core'],
+                'equipment': [],
+                'category': 'bodyweight',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': None,
+                                    'per_hand': False,
+                                    'reasoning': 'Bodyweight exercise - start with knee push-ups '
+                                                 'if needed, progress to full'}},
+               {'canonical': 'Lat Pulldown',
+                'variations': ['Pulldown', 'Lat Pull Down'],
+                'muscle_groups': ['Lats', 'Biceps'],
+                'equipment': ['Cable Machine'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 40.0,
+                                    'per_hand': False,
+                                    'reasoning': '40 lbs - focus on pulling with your back, not '
+                                                 'arms'}},
+               {'canonical': 'Dumbbell Row',
+                'variations': ['DB Row', 'Single Arm Row', 'One Arm Row'],
+                'muscle_groups': ['Lats', 'Rhomboids', 'Biceps'],
+                'equipment': ['Dumbbells', 'Bench'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 25.0,
+                                    'per_hand': True,
+                                    'reasoning': '25 lbs per hand - retract scapula, pull to hip '
+                                                 'not chest'}},
+               {'canonical': 'Barbell Row',
+                'variations': ['BB Row', 'Bent Over Row'],
+                'muscle_groups': ['Lats', 'Rhomboids', 'Lower Back'],
+                'equipment': ['Barbell'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 65.0,
+                                    'per_hand': False,
+                                    'reasoning': '65 lbs - maintain hip hinge, pull to lower '
+                                                 'chest'}},
+               {'canonical': 'Face Pulls',
+                'variations': ['Face Pull', 'Cable Face Pull'],
+                'muscle_groups': ['Rear Delts', 'Traps'],
+                'equipment': ['Cable Machine'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 25.0,
+                                    'per_hand': False,
+                                    'reasoning': '25 lbs - pull to face, external rotation at '
+                                                 'end'}},
+               {'canonical': 'Bicep Curl',
+                'variations': ['DB Curl', 'Dumbbell Curl', 'Curls'],
+                'muscle_groups': ['Biceps'],
+                'equipment': ['Dumbbells'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 15.0,
+                                    'per_hand': True,
+                                    'reasoning': '15 lbs per hand - no swinging, strict form for '
+                                                 'bicep growth'}},
+               {'canonical': 'Hammer Curl',
+                'variations': ['Hammer Curls', 'Neutral Grip Curl'],
+                'muscle_groups': ['Biceps', 'Forearms'],
+                'equipment': ['Dumbbells'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 15.0,
+                                    'per_hand': True,
+                                    'reasoning': '15 lbs - neutral grip hits brachialis, keep '
+                                                 'wrists neutral'}},
+               {'canonical': 'Cable Row',
+                'variations': ['Seated Cable Row', 'Seated Row'],
+                'muscle_groups': ['Lats', 'Rhomboids'],
+                'equipment': ['Cable Machine'],
+                'category': 'compound',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 40.0,
+                                    'per_hand': False,
+                                    'reasoning': '40 lbs - squeeze shoulder blades together at the '
+                                                 'end'}},
+               {'canonical': 'Pull Ups',
+                'variations': ['Pull Up', 'Pullups', 'Chin Ups'],
+                'muscle_groups': ['Lats', 'Biceps'],
+                'equipment': [],
+                'category': 'bodyweight',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': None,
+                                    'per_hand': False,
+                                    'reasoning': 'Bodyweight - use assisted pull-up machine or '
+                                                 'resistance bands if needed'}},
+               {'canonical': 'Squat',
+                'variations': ['Back Squat', 'Barbell Squat', 'BB Squat'],
+                'muscle_groups': ['Quads', 'Glutes', 'Core'],
+                'equipment': ['Barbell', 'Rack'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 65.0,
+                                    'per_hand': False,
+                                    'reasoning': '65 lbs (bar + 10s) - depth is more important '
+                                                 'than weight, break parallel'}},
+               {'canonical': 'Leg Press',
+                'variations': ['Machine Leg Press'],
+                'muscle_groups': ['Quads', 'Glutes'],
+                'equipment': ['Leg Press Machine'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 90.0,
+                                    'per_hand': False,
+                                    'reasoning': '90 lbs - full range of motion, knees to chest'}},
+               {'canonical': 'Deadlift',
+                'variations': ['Barbell Deadlift', 'Conventional Deadlift'],
+                'muscle_groups': ['Hamstrings', 'Glutes', 'Lower Back', 'Traps'],
+                'equipment': ['Barbell'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 95.0,
+                                    'per_hand': False,
+                                    'reasoning': '95 lbs (bar + 25s) - perfect form is critical, '
+                                                 'hinge at hips'}},
+               {'canonical': 'Romanian Deadlift',
+                'variations': ['RDL', 'Stiff Leg Deadlift'],
+                'muscle_groups': ['Hamstrings', 'Glutes'],
+                'equipment': ['Barbell'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 65.0,
+                                    'per_hand': False,
+                                    'reasoning': '65 lbs - feel the hamstring stretch, slight knee '
+                                                 'bend'}},
+               {'canonical': 'Leg Curl',
+                'variations': ['Hamstring Curl', 'Lying Leg Curl'],
+                'muscle_groups': ['Hamstrings'],
+                'equipment': ['Leg Curl Machine'],
+                'category': 'isolation',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 50.0,
+                                    'per_hand': False,
+                                    'reasoning': '50 lbs - full contraction at top, slow '
+                                                 'eccentric'}},
+               {'canonical': 'Leg Extension',
+                'variations': ['Quad Extension'],
+                'muscle_groups': ['Quads'],
+                'equipment': ['Leg Extension Machine'],
+                'category': 'isolation',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 50.0,
+                                    'per_hand': False,
+                                    'reasoning': '50 lbs - squeeze quads at full extension, '
+                                                 'controlled descent'}},
+               {'canonical': 'Calf Raise',
+                'variations': ['Standing Calf Raise', 'Seated Calf Raise'],
+                'muscle_groups': ['Calves'],
+                'equipment': ['Calf Raise Machine'],
+                'category': 'isolation',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 100.0,
+                                    'per_hand': False,
+                                    'reasoning': '100 lbs - calves are strong, full stretch at '
+                                                 'bottom, pause at top'}},
+               {'canonical': 'Lunge',
+                'variations': ['Walking Lunge', 'Dumbbell Lunge', 'DB Lunge'],
+                'muscle_groups': ['Quads', 'Glutes'],
+                'equipment': ['Dumbbells'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 15.0,
+                                    'per_hand': True,
+                                    'reasoning': '15 lbs per hand - balance is challenging, knee '
+                                                 "shouldn't pass toes"}},
+               {'canonical': 'Bulgarian Split Squat',
+                'variations': ['Split Squat', 'Rear Foot Elevated Split Squat'],
+                'muscle_groups': ['Quads', 'Glutes'],
+                'equipment': ['Dumbbells', 'Bench'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 15.0,
+                                    'per_hand': True,
+                                    'reasoning': '15 lbs per hand - very challenging for balance, '
+                                                 'start light'}},
+               {'canonical': 'Hip Thrust',
+                'variations': ['Barbell Hip Thrust', 'Glute Bridge'],
+                'muscle_groups': ['Glutes', 'Hamstrings'],
+                'equipment': ['Barbell', 'Bench'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 65.0,
+                                    'per_hand': False,
+                                    'reasoning': '65 lbs - squeeze glutes at top, use pad for '
+                                                 'comfort'}},
+               {'canonical': 'Goblet Squat',
+                'variations': ['DB Goblet Squat'],
+                'muscle_groups': ['Quads', 'Glutes'],
+                'equipment': ['Dumbbell'],
+                'category': 'compound',
+                'body_region': 'lower',
+                'beginner_weight': {'lbs': 25.0,
+                                    'per_hand': False,
+                                    'reasoning': '25 lbs total - great for learning squat form, '
+                                                 'deep as possible'}},
+               {'canonical': 'Dips',
+                'variations': ['Tricep Dips', 'Chest Dips'],
+                'muscle_groups': ['Chest', 'Triceps', 'Shoulders'],
+                'equipment': [],
+                'category': 'bodyweight',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': None,
+                                    'per_hand': False,
+                                    'reasoning': 'Bodyweight - use assisted dip machine if needed, '
+                                                 'lean forward for chest'}},
+               {'canonical': 'Plank',
+                'variations': ['Front Plank', 'Forearm Plank'],
+                'muscle_groups': ['Core', 'Abs'],
+                'equipment': [],
+                'category': 'bodyweight',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': None,
+                                    'per_hand': False,
+                                    'reasoning': 'Bodyweight - hold for time, keep hips level, '
+                                                 'engage core'}},
+               {'canonical': 'Cable Crossover',
+                'variations': ['Cable Cross', 'High Cable Fly'],
+                'muscle_groups': ['Chest'],
+                'equipment': ['Cable Machine'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 15.0,
+                                    'per_hand': False,
+                                    'reasoning': '15 lbs - focus on chest squeeze, not moving '
+                                                 'heavy weight'}},
+               {'canonical': 'Preacher Curl',
+                'variations': ['EZ Bar Preacher Curl', 'Machine Preacher Curl'],
+                'muscle_groups': ['Biceps'],
+                'equipment': ['EZ Bar', 'Preacher Bench'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 40.0,
+                                    'per_hand': False,
+                                    'reasoning': '40 lbs - strict form only, no momentum '
+                                                 'possible'}},
+               {'canonical': 'Shrugs',
+                'variations': ['Dumbbell Shrugs', 'Trap Shrugs'],
+                'muscle_groups': ['Traps'],
+                'equipment': ['Dumbbells'],
+                'category': 'isolation',
+                'body_region': 'upper',
+                'beginner_weight': {'lbs': 30.0,
+                                    'per_hand': True,
+                                    'reasoning': '30 lbs per hand - straight up and down, squeeze '
+                                                 'traps at top'}}],
+ 'default_weights': {'compound_upper': 25.0,
+                     'compound_lower': 95.0,
+                     'isolation_upper': 15.0,
+                     'isolation_lower': 50.0,
+                     'bodyweight': None,
+                     'cable_machine': 30.0}}
+
+# Lowercased canonical name or variation → index into CATALOG['exercises']
+LOOKUP = {'dumbbell bench press': 0,
+ 'db bench press': 0,
+ 'db bench': 0,
+ 'dumbbell press': 0,
+ 'barbell bench press': 1,
+ 'bb bench press': 1,
+ 'bench press': 1,
+ 'flat bench': 1,
+ 'incline dumbbell press': 2,
+ 'incline db press': 2,
+ 'incline press': 2,
+ 'overhead press': 3,
+ 'military press': 3,
+ 'shoulder press': 3,
+ 'ohp': 3,
+ 'cable fly': 4,
+ 'cable flys': 4,
+ 'cable chest fly': 4,
+ 'tricep pushdown': 5,
+ 'cable pushdown': 5,
+ 'tricep cable pushdown': 5,
+ 'tricep extension': 6,
+ 'overhead tricep extension': 6,
+ 'skull crusher': 6,
+ 'lateral raise': 7,
+ 'side raise': 7,
+ 'dumbbell lateral raise': 7,
+ 'db lateral raise': 7,
+ 'front raise': 8,
+ 'dumbbell front raise': 8,
+ 'db front raise': 8,
+ 'push ups': 9,
+ 'pushups': 9,
+ 'push up': 9,
+ 'lat pulldown': 10,
+ 'pulldown': 10,
+ 'lat pull down': 10,
+ 'dumbbell row': 11,
+ 'db row': 11,
+ 'single arm row': 11,
+ 'one arm row': 11,
+ 'barbell row': 12,
+ 'bb row': 12,
+ 'bent over row': 12,
+ 'face pulls': 13,
+ 'face pull': 13,
+ 'cable face pull': 13,
+ 'bicep curl': 14,
+ 'db curl': 14,
+ 'dumbbell curl': 14,
+ 'curls': 14,
+ 'hammer curl': 15,
+ 'hammer curls': 15,
+ 'neutral grip curl': 15,
+ 'cable row': 16,
+ 'seated cable row': 16,
+ 'seated row': 16,
+ 'pull ups': 17,
+ 'pull up': 17,
+ 'pullups': 17,
+ 'chin ups': 17,
+ 'squat': 18,
+ 'back squat': 18,
+ 'barbell squat': 18,
+ 'bb squat': 18,
+ 'leg press': 19,
+ 'machine leg press': 19,
+ 'deadlift': 20,
+ 'barbell deadlift': 20,
+ 'conventional deadlift': 20,
+ 'romanian deadlift': 21,
+ 'rdl': 21,
+ 'stiff leg deadlift': 21,
+ 'leg curl': 22,
+ 'hamstring curl': 22,
+ 'lying leg curl': 22,
+ 'leg extension': 23,
+ 'quad extension': 23,
+ 'calf raise': 24,
+ 'standing calf raise': 24,
+ 'seated calf raise': 24,
+ 'lunge': 25,
+ 'walking lunge': 25,
+ 'dumbbell lunge': 25,
+ 'db lunge': 25,
+ 'bulgarian split squat': 26,
+ 'split squat': 26,
+ 'rear foot elevated split squat': 26,
+ 'hip thrust': 27,
+ 'barbell hip thrust': 27,
+ 'glute bridge': 27,
+ 'goblet squat': 28,
+ 'db goblet squat': 28,
+ 'dips': 29,
+ 'tricep dips': 29,
+ 'chest dips': 29,
+ 'plank': 30,
+ 'front plank': 30,
+ 'forearm plank': 30,
+ 'cable crossover': 31,
+ 'cable cross': 31,
+ 'high cable fly': 31,
+ 'preacher curl': 32,
+ 'ez bar preacher curl': 32,
+ 'machine preacher curl': 32,
+ 'shrugs': 33,
+ 'dumbbell shrugs': 33,
+ 'trap shrugs': 33}
+
+# Canonical name → (beginner weight lbs, reasoning)
+RESOLVED = {'Dumbbell Bench Press': (20.0,
+                          'Start with 20 lbs per hand - focus on controlled reps with proper form'),
+ 'Barbell Bench Press': (45.0,
+                         'Start with just the bar (45 lbs) - master the movement before adding '
+                         'plates'),
+ 'Incline Dumbbell Press': (20.0,
+                            '20 lbs per hand - incline is harder than flat, focus on upper chest '
+                            'contraction'),
+ 'Overhead Press': (15.0,
+                    '15 lbs per hand - shoulders are delicate, prioritize strict form over weight'),
+ 'Cable Fly': (20.0, '20 lbs total - focus on the stretch and squeeze, not the weight'),
+ 'Tricep Pushdown': (30.0, '30 lbs - keep elbows tucked, full extension at bottom'),
+ 'Tricep Extension': (15.0, '15 lbs - protect elbows, controlled movement throughout'),
+ 'Lateral Raise': (10.0,
+                   '10 lbs per hand - very light, focus on time under tension and shoulder burn'),
+ 'Front Raise': (10.0, '10 lbs - keep core engaged, avoid swinging'),
+ 'Push Ups': (None, 'Bodyweight exercise - start with knee push-ups if needed, progress to full'),
+ 'Lat Pulldown': (40.0, '40 lbs - focus on pulling with your back, not arms'),
+ 'Dumbbell Row': (25.0, '25 lbs per hand - retract scapula, pull to hip not chest'),
+ 'Barbell Row': (65.0, '65 lbs - maintain hip hinge, pull to lower chest'),
+ 'Face Pulls': (25.0, '25 lbs - pull to face, external rotation at end'),
+ 'Bicep Curl': (15.0, '15 lbs per hand - no swinging, strict form for bicep growth'),
+ 'Hammer Curl': (15.0, '15 lbs - neutral grip hits brachialis, keep wrists neutral'),
+ 'Cable Row': (40.0, '40 lbs - squeeze shoulder blades together at the end'),
+ 'Pull Ups': (None, 'Bodyweight - use assisted pull-up machine or resistance bands if needed'),
+ 'Squat': (65.0, '65 lbs (bar + 10s) - depth is more important than weight, break parallel'),
+ 'Leg Press': (90.0, '90 lbs - full range of motion, knees to chest'),
+ 'Deadlift': (95.0, '95 lbs (bar + 25s) - perfect form is critical, hinge at hips'),
+ 'Romanian Deadlift': (65.0, '65 lbs - feel the hamstring stretch, slight knee bend'),
+ 'Leg Curl': (50.0, '50 lbs - full contraction at top, slow eccentric'),
+ 'Leg Extension': (50.0, '50 lbs - squeeze quads at full extension, controlled descent'),
+ 'Calf Raise': (100.0, '100 lbs - calves are strong, full stretch at bottom, pause at top'),
+ 'Lunge': (15.0, "15 lbs per hand - balance is challenging, knee shouldn't pass toes"),
+ 'Bulgarian Split Squat': (15.0, '15 lbs per hand - very challenging for balance, start light'),
+ 'Hip Thrust': (65.0, '65 lbs - squeeze glutes at top, use pad for comfort'),
+ 'Goblet Squat': (25.0, '25 lbs total - great for learning squat form, deep as possible'),
+ 'Dips': (None, 'Bodyweight - use assisted dip machine if needed, lean forward for chest'),
+ 'Plank': (None, 'Bodyweight - hold for time, keep hips level, engage core'),
+ 'Cable Crossover': (15.0, '15 lbs - focus on chest squeeze, not moving heavy weight'),
+ 'Preacher Curl': (40.0, '40 lbs - strict form only, no momentum possible'),
+ 'Shrugs': (30.0, '30 lbs per hand - straight up and down, squeeze traps at top')}
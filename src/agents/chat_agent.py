@@ -14,6 +14,8 @@ Analogy: Like a personal trainer who can:
 They're conversational AND knowledgeable - best of both worlds!
 """
 
+import asyncio
+
 from langchain_anthropic import ChatAnthropic
 from langgraph.prebuilt import create_react_agent
 from src.tools.query_tools import (
@@ -294,6 +296,33 @@ class ChatAgent:
             "tool_calls": tool_calls
         }
 
+    def chat_batch(self, prompts: list[str], max_concurrency: int = 4) -> list[dict]:
+        """
+        Send several independent messages and return their results in order.
+
+        Each prompt is a fresh conversation (no shared history). Calls run
+        concurrently in worker threads, at most max_concurrency at a time
+        to stay under provider rate limits; the agent keeps no per-call
+        state, so this is safe.
+
+        Args:
+            prompts: Messages to send
+            max_concurrency: Max calls in flight at once
+
+        Returns:
+            One chat() result dict per prompt, in prompt order
+        """
+        async def run():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def chat_one(prompt):
+                async with semaphore:
+                    return await asyncio.to_thread(self.chat, prompt)
+
+            return await asyncio.gather(*(chat_one(p) for p in prompts))
+
+        return asyncio.run(run())
+
 
 # ============================================================================
 # Factory Function
@@ -24,6 +24,8 @@ Architecture:
          Response
 """
 
+import asyncio
+
 from src.agents.router import IntentRouter, quick_route
 from src.chains.chat_chain import ChatChain
 from src.agents.chat_agent import ChatAgent
@@ -73,7 +75,24 @@ class GymBroOrchestrator:
 
         print("✅ All systems ready!\n")
 
-    def process_message(self, user_input: str, chat_history: list = None) -> dict:
+    def classify_intent(self, user_input: str) -> str:
+        """
+        Classify a message: quick pattern match first, LLM router as fallback.
+
+        Depends only on the message text (not the chat history), so it can be
+        run ahead of time, e.g. for a follow-up while the current turn is
+        still being answered.
+        """
+        # Try quick pattern matching first (faster!)
+        intent = quick_route(user_input)
+
+        if intent is None:
+            # Fall back to full LLM classification
+            intent = self.router.route(user_input)
+
+        return intent
+
+    def process_message(self, user_input: str, chat_history: list = None, intent: str = None) -> dict:
         """
         Main entry point - process a user message and return a response.
 
@@ -81,6 +100,8 @@ class GymBroOrchestrator:
             user_input: What the user said
             chat_history: Optional list of previous messages for context
                          Format: [{"role": "user", "content": "..."}, {"role": "assistant", "content": "..."}, ...]
+            intent: Optional intent already computed with classify_intent();
+                    skips classification
 
         Returns:
             Dict with:
@@ -108,13 +129,9 @@ class GymBroOrchestrator:
             #   "session_data": {...}  # Full session state
             # }
         """
-        # Step 1: Classify intent
-        # Try quick pattern matching first (faster!)
-        intent = quick_route(user_input)
-
+        # Step 1: Classify intent (unless the caller already did)
         if intent is None:
-            # Fall back to full LLM classification
-            intent = self.router.route(user_input)
+            intent = self.classify_intent(user_input)
 
         print(f"🎯 Intent: {intent}")
 
@@ -129,6 +146,25 @@ class GymBroOrchestrator:
             "session_data": session_data
         }
 
+    async def aprocess_message(self, user_input: str, chat_history: list = None, intent: str = None) -> dict:
+        """
+        Async version of process_message().
+
+        Runs process_message() in a worker thread so callers can await
+        several independent messages concurrently (e.g. with asyncio.gather).
+        The handlers keep no per-call state on the orchestrator, so
+        concurrent calls are safe.
+
+        Args:
+            user_input: What the user said
+            chat_history: Optional list of previous messages for context
+            intent: Optional pre-computed intent (see process_message())
+
+        Returns:
+            Same dict as process_message()
+        """
+        return await asyncio.to_thread(self.process_message, user_input, chat_history, intent)
+
     def _route_to_handler(self, intent: str, user_input: str, chat_history: list = None) -> tuple[str, str]:
         """
         Internal method to route to the correct handler based on intent.
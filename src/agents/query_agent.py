@@ -14,6 +14,7 @@ This is called the "ReAct" pattern (Reasoning + Acting).
 """
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.prebuilt import create_react_agent
 from src.tools.query_tools import QUERY_TOOLS
@@ -79,16 +80,19 @@ class QueryAgent:
     - Can make mistakes (might use wrong tool)
     """
 
-    def __init__(self, model_name: str = "claude-sonnet-4-20250514"):
+    def __init__(self, model_name: str = "claude-sonnet-4-20250514", llm: BaseChatModel | None = None):
         """
         Initialize the query agent.
 
         Args:
             model_name: Which Claude model to use
                        Note: We use temperature=0 for agents (consistent, logical)
+            llm: Pre-built chat model to use instead of creating one
+                 (lets tests share a single client). model_name is
+                 ignored when given.
         """
         # The LLM - note we use temperature=0 for agents (need consistency!)
-        self.llm = ChatAnthropic(
+        self.llm = llm or ChatAnthropic(
             model=model_name,
             temperature=0  # Agents need to be logical and consistent
         )
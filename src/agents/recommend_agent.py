@@ -14,6 +14,7 @@ They THINK about your training program, USE TOOLS to check progress, then RECOMM
 """
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import BaseChatModel
 from langgraph.prebuilt import create_react_agent
 from src.tools.recommend_tools import RECOMMEND_TOOLS
 
@@ -110,16 +111,19 @@ class RecommendAgent:
         Think → Act → Observe → Respond
     """
 
-    def __init__(self, model_name: str = "claude-sonnet-4-20250514"):
+    def __init__(self, model_name: str = "claude-sonnet-4-20250514", llm: BaseChatModel | None = None):
         """
         Initialize the recommend agent.
 
         Args:
             model_name: Which Claude model to use
                        Uses temperature=0 for consistent logic
+            llm: Pre-built chat model to use instead of creating one
+                 (lets tests share a single client). model_name is
+                 ignored when given.
         """
         # The LLM - temperature=0 for consistent recommendations
-        self.llm = ChatAnthropic(
+        self.llm = llm or ChatAnthropic(
             model=model_name,
             temperature=0  # Need logical, consistent planning
         )
@@ -5,6 +5,8 @@ This is the entry point for the agentic system. Uses Claude to classify
 intent, then routes to the appropriate agent or chain.
 """
 
+import re
+
 from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
@@ -98,19 +100,25 @@ QUICK_PATTERNS = {
 }
 
 
+# All QUICK_PATTERNS in one regex, one named group per intent. Each branch is
+# a lookahead anchored at the start, so intents are tried in dict order (the
+# first intent with any phrase anywhere wins), same as checking them in turn.
+_QUICK_ROUTE_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?P<{intent}>{'|'.join(map(re.escape, patterns))}))"
+        for intent, patterns in QUICK_PATTERNS.items()
+    ),
+    re.DOTALL,
+)
+
+
 def quick_route(user_input: str) -> Intent | None:
     """
     Fast pattern-based routing for obvious cases.
     Returns None if uncertain (should use full classifier).
     """
-    lower = user_input.lower()
-    
-    for intent, patterns in QUICK_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in lower:
-                return intent
-    
-    return None
+    match = _QUICK_ROUTE_RE.match(user_input.lower())
+    return match.lastgroup if match else None
 
 
 def get_router() -> IntentRouter:
@@ -7,6 +7,11 @@ Provides next exercise suggestions based on:
 - Weight progression from historical data
 """
 
+import hashlib
+import json
+import os
+import re
+from functools import lru_cache
 from typing import Literal
 from src.tools.recommend_tools import get_workout_template
 from src.data import get_exercise_history
@@ -289,26 +294,125 @@ def _requires_unavailable_equipment(exercise_name: str, equipment_unavailable: l
 
 # ==================== BEGINNER WEIGHT LOOKUP ====================
 
+# Keyword groups for classifying exercises missing from the catalog, in
+# priority order (first hit wins). Plain substrings, no word boundaries,
+# so plurals like "dips" still match.
+_CATEGORY_PATTERNS = [
+    (re.compile(r"pull up|chin up|dip|push up|plank"), 'bodyweight'),
+    (re.compile(r"squat|deadlift|lunge|leg press"), 'compound_lower'),
+    (re.compile(r"leg curl|leg extension|calf|hamstring curl"), 'isolation_lower'),
+    (re.compile(r"cable"), 'cable_machine'),
+    (re.compile(r"bench|press|row|pulldown|pull down"), 'compound_upper'),
+]
+
+# Reasoning shown with classification-based default weights
+_DEFAULT_WEIGHT_REASONING = {
+    'compound_upper': 'Start with controlled weight, 8-10 reps',
+    'compound_lower': 'Focus on depth and form over weight',
+    'isolation_upper': 'Light weight for strict form and control',
+    'isolation_lower': 'Moderate weight with full range of motion',
+    'cable_machine': 'Start light to learn the movement'
+}
+
+
+_CATALOG_PATH = os.path.join(os.path.dirname(__file__), '../../data/exercise_catalog.json')
+
+_EMPTY_CATALOG = {"exercises": [], "default_weights": {}, "_lookup": {}, "_canonicals": [], "_resolved": {}}
+
+
+@lru_cache(maxsize=1)
 def _load_exercise_catalog() -> dict:
     """
     Load exercise catalog with beginner weight suggestions.
 
+    The file is read once per process; callers must treat the returned dict
+    as read-only. Use _load_exercise_catalog.cache_clear() to force a reload.
+
+    Prefers the pre-built src/agents/_catalog_data.py (see
+    scripts/build_catalog.py) while its source hash matches the JSON,
+    skipping the JSON parse and index build; otherwise parses the JSON.
+
     Returns:
         Exercise catalog dict with exercises and default_weights
     """
-    import json
-    import os
+    try:
+        with open(_CATALOG_PATH, 'rb') as f:
+            raw = f.read()
+    except Exception:
+        return dict(_EMPTY_CATALOG)
 
-    catalog_path = os.path.join(
-        os.path.dirname(__file__),
-        '../../data/exercise_catalog.json'
-    )
+    try:
+        from src.agents import _catalog_data
+    except ImportError:
+        _catalog_data = None
+
+    if _catalog_data is not None and _catalog_data.SOURCE_HASH == catalog_source_hash(raw):
+        catalog = dict(_catalog_data.CATALOG)
+        exercises = catalog.get('exercises', [])
+        catalog['_lookup'] = {name: exercises[i] for name, i in _catalog_data.LOOKUP.items()}
+        catalog['_canonicals'] = [(ex['canonical'].lower(), ex) for ex in exercises]
+        catalog['_resolved'] = dict(_catalog_data.RESOLVED)
+        return catalog
 
     try:
-        with open(catalog_path, 'r') as f:
-            return json.load(f)
+        catalog = json.loads(raw)
     except Exception:
-        return {"exercises": [], "default_weights": {}}
+        return dict(_EMPTY_CATALOG)
+
+    return _index_catalog(catalog)
+
+
+def catalog_source_hash(raw: bytes) -> str:
+    """Hash of the catalog JSON bytes, used to detect a stale _catalog_data.py."""
+    return hashlib.md5(raw).hexdigest()
+
+
+def _index_catalog(catalog: dict) -> dict:
+    """
+    Add the lookup structures used by the matchers to a parsed catalog.
+
+    Args:
+        catalog: Catalog dict as parsed from exercise_catalog.json
+
+    Returns:
+        The same dict with _lookup, _canonicals and _resolved added
+    """
+    # Exact-name index: canonical names and variations → entry. The first
+    # entry to claim a name wins.
+    lookup = {}
+    for ex in catalog.get('exercises', []):
+        for name in [ex['canonical'], *ex.get('variations', [])]:
+            lookup.setdefault(name.lower(), ex)
+    catalog['_lookup'] = lookup
+
+    # Lowercased canonical names for the substring fallback in
+    # _fuzzy_match_exercise, so misses don't re-lower the catalog per call
+    catalog['_canonicals'] = [
+        (ex['canonical'].lower(), ex) for ex in catalog.get('exercises', [])
+    ]
+
+    # Resolved (weight_lbs, reasoning) per canonical name for _get_beginner_weight
+    catalog['_resolved'] = {
+        ex['canonical']: _resolve_beginner_weight(ex) for ex in catalog.get('exercises', [])
+    }
+
+    return catalog
+
+
+def _resolve_beginner_weight(exercise: dict) -> tuple[float | None, str]:
+    """
+    Read the beginner weight and reasoning from a catalog entry.
+
+    Args:
+        exercise: Catalog exercise dict
+
+    Returns:
+        Tuple of (weight_lbs, reasoning)
+    """
+    beginner_info = exercise.get('beginner_weight', {})
+    weight = beginner_info.get('lbs')
+    reasoning = beginner_info.get('reasoning', 'Start light, focus on form')
+    return (weight, reasoning)
 
 
 def _fuzzy_match_exercise(exercise_name: str, catalog: dict) -> dict | None:
@@ -324,19 +428,23 @@ def _fuzzy_match_exercise(exercise_name: str, catalog: dict) -> dict | None:
     """
     exercise_lower = exercise_name.lower().strip()
 
-    for ex in catalog.get('exercises', []):
-        # Check canonical name
-        if ex['canonical'].lower() == exercise_lower:
-            return ex
-
-        # Check variations
-        for variation in ex.get('variations', []):
-            if variation.lower() == exercise_lower:
+    # Exact canonical/variation match (O(1) via the index built at load time)
+    exact = catalog.get('_lookup', {}).get(exercise_lower)
+    if exact is not None:
+        return exact
+
+    canonicals = catalog.get('_canonicals')
+    if canonicals is None:
+        canonicals = [(ex['canonical'].lower(), ex) for ex in catalog.get('exercises', [])]
+
+    query_len = len(exercise_lower)
+    for canonical_lower, ex in canonicals:
+        # Fuzzy matching: check if exercise contains key terms. Only the
+        # shorter string can be contained in the longer, so test one way.
+        if len(canonical_lower) <= query_len:
+            if canonical_lower in exercise_lower:
                 return ex
-
-        # Fuzzy matching: check if exercise contains key terms
-        canonical_lower = ex['canonical'].lower()
-        if canonical_lower in exercise_lower or exercise_lower in canonical_lower:
+        elif exercise_lower in canonical_lower:
             return ex
 
     return None
@@ -352,56 +460,40 @@ def _classify_exercise_for_default(exercise_name: str) -> str:
     Returns:
         Category key for default_weights lookup
     """
-    name_lower = exercise_name.lower()
-
-    # Bodyweight exercises
-    bodyweight_keywords = ['pull up', 'chin up', 'dip', 'push up', 'plank']
-    if any(kw in name_lower for kw in bodyweight_keywords):
-        return 'bodyweight'
-
-    # Lower body compound
-    lower_compound = ['squat', 'deadlift', 'lunge', 'leg press']
-    if any(kw in name_lower for kw in lower_compound):
-        return 'compound_lower'
+    return _classify_lowered(exercise_name.lower())
 
-    # Lower body isolation
-    lower_isolation = ['leg curl', 'leg extension', 'calf', 'hamstring curl']
-    if any(kw in name_lower for kw in lower_isolation):
-        return 'isolation_lower'
 
-    # Cable exercises
-    if 'cable' in name_lower:
-        return 'cable_machine'
-
-    # Upper body compound
-    upper_compound = ['bench', 'press', 'row', 'pulldown', 'pull down']
-    if any(kw in name_lower for kw in upper_compound):
-        return 'compound_upper'
+@lru_cache(maxsize=1024)
+def _classify_lowered(name_lower: str) -> str:
+    """Cached body of _classify_exercise_for_default, keyed on the lowercased name."""
+    for pattern, category in _CATEGORY_PATTERNS:
+        if pattern.search(name_lower):
+            return category
 
     # Default to upper isolation (conservative)
     return 'isolation_upper'
 
 
-def _get_beginner_weight(exercise_name: str) -> tuple[float | None, str]:
+def _get_beginner_weight(exercise_name: str, catalog: dict | None = None) -> tuple[float | None, str]:
     """
     Get beginner-friendly starting weight for an exercise.
 
     Args:
         exercise_name: Name of exercise
+        catalog: Exercise catalog dict (loaded if not given)
 
     Returns:
         Tuple of (weight_lbs, reasoning)
     """
-    catalog = _load_exercise_catalog()
+    if catalog is None:
+        catalog = _load_exercise_catalog()
 
     # Try exact/fuzzy match in catalog
     matched_exercise = _fuzzy_match_exercise(exercise_name, catalog)
 
     if matched_exercise:
-        beginner_info = matched_exercise.get('beginner_weight', {})
-        weight = beginner_info.get('lbs')
-        reasoning = beginner_info.get('reasoning', 'Start light, focus on form')
-        return (weight, reasoning)
+        resolved = catalog.get('_resolved', {}).get(matched_exercise['canonical'])
+        return resolved if resolved is not None else _resolve_beginner_weight(matched_exercise)
 
     # Fallback: Use classification-based defaults
     category = _classify_exercise_for_default(exercise_name)
@@ -411,16 +503,7 @@ def _get_beginner_weight(exercise_name: str) -> tuple[float | None, str]:
     if default_weight is None:  # Bodyweight
         return (None, "Bodyweight exercise - use assistance if needed")
 
-    # Build reasoning based on category
-    reasoning_map = {
-        'compound_upper': 'Start with controlled weight, 8-10 reps',
-        'compound_lower': 'Focus on depth and form over weight',
-        'isolation_upper': 'Light weight for strict form and control',
-        'isolation_lower': 'Moderate weight with full range of motion',
-        'cable_machine': 'Start light to learn the movement'
-    }
-
-    reasoning = reasoning_map.get(category, 'Start conservatively')
+    reasoning = _DEFAULT_WEIGHT_REASONING.get(category, 'Start conservatively')
 
     return (default_weight, reasoning)
 
@@ -519,8 +602,41 @@ def get_exercise_info(exercise_name: str) -> dict:
             "found_in_catalog": bool
         }
     """
+    return _build_exercise_info(exercise_name, _load_exercise_catalog())
+
+
+def get_exercise_info_batch(exercise_names: list[str]) -> list[dict]:
+    """
+    Get exercise information for several exercises at once.
+
+    Loads the catalog once and resolves every name against it, rather than
+    going through get_exercise_info per name. Repeated names are resolved
+    once (including the history lookup) and returned as separate copies.
+
+    Args:
+        exercise_names: Names of the exercises
+
+    Returns:
+        List of get_exercise_info dicts, in the same order as exercise_names
+    """
     catalog = _load_exercise_catalog()
+    resolved = {
+        name: _build_exercise_info(name, catalog) for name in dict.fromkeys(exercise_names)
+    }
+    return [dict(resolved[name]) for name in exercise_names]
 
+
+def _build_exercise_info(exercise_name: str, catalog: dict) -> dict:
+    """
+    Build the get_exercise_info dict for one exercise against a loaded catalog.
+
+    Args:
+        exercise_name: Name of the exercise
+        catalog: Exercise catalog dict
+
+    Returns:
+        Exercise information dict (see get_exercise_info)
+    """
     # Try to match exercise in catalog
     matched_exercise = _fuzzy_match_exercise(exercise_name, catalog)
 
@@ -535,7 +651,7 @@ def get_exercise_info(exercise_name: str) -> dict:
         is_first_time = True
 
     # Get beginner weight (even if not first time, useful for reference)
-    beginner_weight, weight_reasoning = _get_beginner_weight(exercise_name)
+    beginner_weight, weight_reasoning = _get_beginner_weight(exercise_name, catalog)
 
     if matched_exercise:
         # Found in catalog - return full info
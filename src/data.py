@@ -3,13 +3,46 @@ Data layer for reading/writing workout data.
 
 Migrated from JSON files to Supabase (Postgres) for persistent cloud storage.
 All function signatures remain unchanged for backward compatibility.
+
+Whole-table reads (logs, templates, exercises, weekly split) are cached in
+memory for a short TTL and invalidated by every write in this module, so
+repeated reads within a page render or test run hit the database once.
 """
 
+import copy
+import time
+from bisect import bisect_left, bisect_right
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import Callable, Optional
 from src.database import get_supabase_client
 
 
+# ============================================================================
+# Read Cache
+# ============================================================================
+
+# Upper bound on staleness for writes made outside this process
+_CACHE_TTL_SECONDS = 60
+
+_read_cache: dict[tuple, tuple[float, object]] = {}
+
+
+def _cached_read(key: tuple, fetch: Callable[[], object]) -> object:
+    """Return the cached result for key, calling fetch() on a miss or expiry."""
+    hit = _read_cache.get(key)
+    now = time.monotonic()
+    if hit is not None and now - hit[0] < _CACHE_TTL_SECONDS:
+        return hit[1]
+    value = fetch()
+    _read_cache[key] = (now, value)
+    return value
+
+
+def clear_data_cache() -> None:
+    """Drop all cached reads. Called after every write; tests may call it too."""
+    _read_cache.clear()
+
+
 def migrate_supplementary_work(log: dict) -> dict:
     """
     Migrate old supplementary_work format to new structured format.
@@ -66,6 +99,28 @@ def get_all_logs(include_deleted: bool = False) -> list:
     Returns:
         List of workout logs
     """
+    logs, _ = _cached_logs(include_deleted)
+    # Deep copy so callers can sort/filter the list or edit a log (and its
+    # exercises) without touching the cache
+    return copy.deepcopy(logs)
+
+
+def _cached_logs(include_deleted: bool) -> tuple[list, list]:
+    """
+    Cached (logs newest first, their dates oldest first).
+
+    The ascending date list is built alongside the logs so date-range
+    lookups can bisect it; both expire together.
+    """
+    def fetch():
+        logs = _fetch_all_logs(include_deleted)
+        return logs, [log.get("date") or "" for log in reversed(logs)]
+
+    return _cached_read(("logs", include_deleted), fetch)
+
+
+def _fetch_all_logs(include_deleted: bool) -> list:
+    """Query all workout logs from the database, newest first."""
     sb = get_supabase_client()
 
     query = sb.table("workout_logs").select("*").order("date", desc=True)
@@ -78,6 +133,10 @@ def get_all_logs(include_deleted: bool = False) -> list:
     # Migrate supplementary_work field from old format to new
     logs = [migrate_supplementary_work(log) for log in logs]
 
+    # Already ordered by the query; the stable re-sort only guarantees the
+    # invariant get_logs_by_date_range bisects on
+    logs.sort(key=lambda log: log.get("date") or "", reverse=True)
+
     return logs
 
 
@@ -93,23 +152,12 @@ def get_logs_by_date_range(start: date, end: date, include_deleted: bool = False
     Returns:
         List of workout logs in date range
     """
-    sb = get_supabase_client()
-
-    query = sb.table("workout_logs").select("*") \
-        .gte("date", start.isoformat()) \
-        .lte("date", end.isoformat()) \
-        .order("date", desc=True)
-
-    if not include_deleted:
-        query = query.eq("deleted", False)
-
-    result = query.execute()
-    logs = result.data
-
-    # Migrate supplementary_work field
-    logs = [migrate_supplementary_work(log) for log in logs]
-
-    return logs
+    # Bisect the cached ascending dates (ISO strings sort chronologically),
+    # then map the window back onto the newest-first log list
+    logs, dates = _cached_logs(include_deleted)
+    lo = bisect_left(dates, start.isoformat())
+    hi = bisect_right(dates, end.isoformat())
+    return copy.deepcopy(logs[len(logs) - hi:len(logs) - lo])
 
 
 def get_logs_by_exercise(exercise_name: str, include_deleted: bool = False) -> list:
@@ -175,6 +223,7 @@ def add_log(log: dict) -> str:
 
     # Insert into database
     sb.table("workout_logs").insert(log).execute()
+    clear_data_cache()
 
     # Update weekly split tracking
     _update_weekly_split_after_log(log)
@@ -190,6 +239,7 @@ def update_log(log_id: str, updates: dict) -> bool:
         .update(updates) \
         .eq("id", log_id) \
         .execute()
+    clear_data_cache()
 
     return len(result.data) > 0
 
@@ -216,6 +266,7 @@ def delete_log(log_id: str) -> bool:
         }) \
         .eq("id", log_id) \
         .execute()
+    clear_data_cache()
 
     return len(result.data) > 0
 
@@ -251,6 +302,7 @@ def restore_log(log_id: str) -> bool:
         }) \
         .eq("id", log_id) \
         .execute()
+    clear_data_cache()
 
     return len(result.data) > 0
 
@@ -274,6 +326,7 @@ def delete_log_permanent(log_id: str) -> bool:
         .delete() \
         .eq("id", log_id) \
         .execute()
+    clear_data_cache()
 
     return len(result.data) > 0
 
@@ -371,6 +424,11 @@ def cleanup_old_deleted_logs(days_threshold: int = 30) -> dict:
 
 def get_all_templates() -> list:
     """Get all workout templates."""
+    return list(_cached_read(("templates",), _fetch_all_templates))
+
+
+def _fetch_all_templates() -> list:
+    """Query all workout templates from the database."""
     sb = get_supabase_client()
 
     result = sb.table("templates") \
@@ -405,6 +463,11 @@ def get_template(template_id: str) -> Optional[dict]:
 
 def get_all_exercises() -> list:
     """Get all exercise definitions."""
+    return list(_cached_read(("exercises",), _fetch_all_exercises))
+
+
+def _fetch_all_exercises() -> list:
+    """Query all exercise definitions from the database."""
     sb = get_supabase_client()
 
     result = sb.table("exercises") \
@@ -460,6 +523,12 @@ DEFAULT_SPLIT_CONFIG = {
 
 def get_weekly_split() -> dict:
     """Get the weekly split configuration and current progress."""
+    # Deep copy: callers update current_week in place before saving it
+    return copy.deepcopy(_cached_read(("weekly_split",), _fetch_weekly_split))
+
+
+def _fetch_weekly_split() -> dict:
+    """Query the latest weekly split row, inserting the defaults if none exists."""
     sb = get_supabase_client()
 
     # Get the latest weekly split row
@@ -514,6 +583,7 @@ def update_weekly_split(data: dict) -> None:
     else:
         # Insert new row
         sb.table("weekly_split").insert(data).execute()
+    clear_data_cache()
 
 
 def _get_week_start(for_date: Optional[date] = None) -> date:
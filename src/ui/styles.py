@@ -10,18 +10,15 @@ This module provides a unified design system with:
 Mobile-first approach optimized for gym environment (large text, high contrast, touch-friendly).
 """
 
-def get_global_styles():
-    """
-    Returns centralized CSS for the entire app.
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
 
-    Includes design tokens, typography scale, spacing system, and component styles.
-    All pages should import and apply these styles for consistency.
+import streamlit as st
 
-    Returns:
-        str: Complete CSS as a string to be used with st.markdown(unsafe_allow_html=True)
-    """
-    return """
-    <style>
+_GLOBAL_STYLES_CSS = """
     /* ========================================
        DESIGN TOKENS
        ======================================== */
@@ -39,10 +36,10 @@ def get_global_styles():
 
         /* Colors - Accent (Exercise focus with green theme) */
         --color-accent-500: #66BB6A;
-        --color-accent-gradient: linear-gradient(135deg, #4CAF50 0%, #66BB6A 100%);
+        --color-accent-gradient: linear-gradient(135deg, var(--color-primary-500) 0%, var(--color-accent-500) 100%);
 
         /* Colors - Semantic */
-        --color-success: #4CAF50;
+        --color-success: var(--color-primary-500);
         --color-warning: #FFC107;
         --color-error: #F44336;
         --color-info: #2196F3;
@@ -150,53 +147,53 @@ def get_global_styles():
 
     /* Buttons */
     .btn-primary {
-        min-height: 56px !important;
-        font-size: 1.125rem !important;
-        font-weight: 600 !important;
-        padding: var(--space-4) var(--space-6) !important;
-        border-radius: 12px !important;
-        background: var(--color-accent-gradient) !important;
-        color: white !important;
-        border: none !important;
+        min-height: 56px;
+        font-size: 1.125rem;
+        font-weight: 600;
+        padding: var(--space-4) var(--space-6);
+        border-radius: 12px;
+        background: var(--color-accent-gradient);
+        color: white;
+        border: none;
     }
 
     .btn-secondary {
-        min-height: 48px !important;
-        font-size: 1rem !important;
-        font-weight: 500 !important;
-        padding: var(--space-3) var(--space-5) !important;
-        border-radius: 8px !important;
-        background: var(--color-bg-secondary) !important;
-        color: var(--color-text-primary) !important;
-        border: 1px solid var(--color-border) !important;
+        min-height: 48px;
+        font-size: 1rem;
+        font-weight: 500;
+        padding: var(--space-3) var(--space-5);
+        border-radius: 8px;
+        background: var(--color-bg-secondary);
+        color: var(--color-text-primary);
+        border: 1px solid var(--color-border);
     }
 
     .btn-full-width {
-        width: 100% !important;
+        width: 100%;
     }
 
     /* Number inputs for workout (LARGE for sweaty hands) */
     .workout-number-input {
-        min-height: 64px !important;
-        font-size: 1.5rem !important;  /* 24px - LARGE */
-        font-weight: 700 !important;
-        text-align: center !important;
-        border: 2px solid var(--color-border) !important;
-        border-radius: 8px !important;
-        background: var(--color-bg-secondary) !important;
-        color: var(--color-text-primary) !important;
+        min-height: 64px;
+        font-size: 1.5rem;  /* 24px - LARGE */
+        font-weight: 700;
+        text-align: center;
+        border: 2px solid var(--color-border);
+        border-radius: 8px;
+        background: var(--color-bg-secondary);
+        color: var(--color-text-primary);
     }
 
     .workout-number-input:focus {
-        border-color: var(--color-primary-500) !important;
-        outline: 2px solid var(--color-primary-100) !important;
+        border-color: var(--color-primary-500);
+        outline: 2px solid var(--color-primary-100);
         outline-offset: 2px;
     }
 
     /* Cards */
     .card {
         background: var(--color-bg-secondary);
-        padding: var(--space-5);
+        padding: clamp(var(--space-4), 5vw, var(--space-5));  /* Tighter on very small screens */
         border-radius: 12px;
         border: 1px solid var(--color-border);
     }
@@ -229,7 +226,8 @@ def get_global_styles():
     .exercise-banner {
         background: var(--color-accent-gradient);
         color: white;
-        padding: var(--space-6) var(--space-5);
+        /* Tighter on very small screens */
+        padding: clamp(var(--space-5), 6.25vw, var(--space-6)) clamp(var(--space-4), 5vw, var(--space-5));
         border-radius: 12px;
         text-align: center;
         margin-bottom: var(--space-5);
@@ -295,35 +293,42 @@ def get_global_styles():
         margin: var(--space-8) 0;
         line-height: 1;
         font-variant-numeric: tabular-nums; /* Monospace numbers for timer */
+        /* Own compositor layer: per-second text updates repaint only this box */
+        will-change: contents;
+        transform: translateZ(0);
+        contain: layout paint style;
     }
 
     /* Progress bars */
-    .progress-bar {
-        height: 8px;
-        background: var(--color-bg-tertiary);
-        border-radius: 4px;
-        overflow: hidden;
-        margin: var(--space-4) 0;
-    }
-
+    .progress-bar,
     .rest-progress-bar {
         height: 8px;
         background: var(--color-bg-tertiary);
         border-radius: 4px;
         overflow: hidden;
-        margin: var(--space-4) 0 var(--space-6);
     }
 
-    .progress-fill {
+    .progress-bar { margin: var(--space-4) 0; }
+    .rest-progress-bar { margin: var(--space-4) 0 var(--space-6); }
+
+    .progress-fill,
+    .rest-progress-fill {
         height: 100%;
         background: var(--color-accent-gradient);
-        transition: width 0.3s ease;
     }
 
+    .progress-fill { transition: width 0.3s ease; }
     .rest-progress-fill {
-        height: 100%;
-        background: var(--color-accent-gradient);
-        transition: width 1s linear;
+        transform-origin: left;
+        transform: scaleX(0);
+        will-change: transform;
+    }
+
+    /* Rest progress runs as a CSS animation (duration set inline per timer).
+       Scaling instead of animating width keeps it on the compositor. */
+    @keyframes rest-fill {
+        from { transform: scaleX(0); }
+        to { transform: scaleX(1); }
     }
 
     /* Workout progress bar */
@@ -351,7 +356,7 @@ def get_global_styles():
 
     /* Exercise complete banner */
     .exercise-complete-banner {
-        background: linear-gradient(135deg, #4CAF50 0%, #66BB6A 100%);
+        background: var(--color-accent-gradient);
         color: white;
         padding: var(--space-5);
         border-radius: 12px;
@@ -402,13 +407,34 @@ def get_global_styles():
         font-weight: 600;
     }
 
+    /* ========================================
+       RENDERING CONTAINMENT
+       ======================================== */
+
+    /* Repeated list items: skip layout/paint while off-screen.
+       "auto" remembers the last rendered height to avoid scroll jumps. */
+    .card,
+    .activity-item,
+    .set-summary-item,
+    .progress-item {
+        content-visibility: auto;
+        contain-intrinsic-size: auto 80px;
+    }
+
+    /* Keep banner reflows from spreading to the rest of the page */
+    .exercise-banner,
+    .exercise-complete-banner {
+        contain: layout paint;
+    }
+
     /* ========================================
        LAYOUT & SPACING
        ======================================== */
 
-    /* Main container */
+    /* Main container (grows from 1rem on phones to 1.5rem on tablets;
+       5rem bottom keeps content clear of the bottom nav) */
     .main .block-container {
-        padding: 1rem 1rem 5rem 1rem !important;
+        padding: clamp(1rem, 3vw, 1.5rem) clamp(1rem, 3vw, 1.5rem) 5rem !important;
         max-width: 100% !important;
     }
 
@@ -445,6 +471,10 @@ def get_global_styles():
        RESPONSIVE BREAKPOINTS
        ======================================== */
 
+    /* Only two breakpoints: mobile (max-width: 768px) and desktop
+       (min-width: 769px). Smaller screens scale with clamp() instead.
+       scripts/build_css.py merges same-query blocks from every section. */
+
     /* Desktop (≥769px) */
     @media (min-width: 769px) {
         /* Typography scaling */
@@ -462,11 +492,11 @@ def get_global_styles():
         .target-value { font-size: 1.125rem; }
 
         /* Component sizing */
-        .btn-primary { min-height: 48px !important; }
-        .btn-secondary { min-height: 44px !important; }
+        .btn-primary { min-height: 48px; }
+        .btn-secondary { min-height: 44px; }
         .workout-number-input {
-            min-height: 56px !important;
-            font-size: 1.25rem !important;          /* 20px desktop */
+            min-height: 56px;
+            font-size: 1.25rem;                     /* 20px desktop */
         }
         .set-number-display { font-size: 3rem; }    /* 48px desktop */
         .rest-timer-display { font-size: 5rem; }    /* 80px desktop */
@@ -490,27 +520,6 @@ def get_global_styles():
         .bottom-nav { display: none !important; }
     }
 
-    /* Tablet (481px - 768px) */
-    @media (min-width: 481px) and (max-width: 768px) {
-        .main .block-container {
-            padding: 1.5rem 1.5rem 5rem 1.5rem !important;
-        }
-    }
-
-    /* Mobile small (≤480px) */
-    @media (max-width: 480px) {
-        /* Tighter spacing on very small screens */
-        .card { padding: var(--space-4); }
-        .exercise-banner { padding: var(--space-5) var(--space-4); }
-    }
-
-    /* Mobile (≤768px) - ensure bottom nav doesn't cover content */
-    @media (max-width: 768px) {
-        .main .block-container {
-            padding-bottom: 80px !important;
-        }
-    }
-
     /* ========================================
        BOTTOM NAVIGATION (Mobile)
        ======================================== */
@@ -544,7 +553,7 @@ def get_global_styles():
         text-decoration: none;
         font-size: 0.75rem;
         cursor: pointer;
-        transition: all 0.2s;
+        transition: color 0.2s, background-color 0.2s, border-top-color 0.2s;
     }
 
     .bottom-nav-item:active {
@@ -583,7 +592,7 @@ def get_global_styles():
     }
 
     /* Number input styling (apply large workout input styles) */
-    .stNumberInput > div > div > input {
+    .stNumberInput input {
         min-height: 64px;
         font-size: 1.5rem;
         font-weight: 700;
@@ -591,7 +600,7 @@ def get_global_styles():
     }
 
     @media (min-width: 769px) {
-        .stNumberInput > div > div > input {
+        .stNumberInput input {
             min-height: 56px;
             font-size: 1.25rem;
         }
@@ -682,8 +691,8 @@ def get_global_styles():
 
     /* Smooth transitions for interactive elements */
     .stButton > button,
-    .stTextInput > div > div > input,
-    .stSelectbox > div > div > select {
+    .stTextInput input,
+    .stSelectbox select {
         transition: all var(--transition-normal);
     }
 
@@ -800,16 +809,143 @@ def get_global_styles():
 
     @media (min-width: 769px) {
         .mobile-filters {
-            display: none !important;
+            display: none;
         }
     }
 
     /* Desktop-only content (hide on mobile) */
     @media (max-width: 768px) {
         .desktop-only {
-            display: none !important;
+            display: none;
         }
     }
+    """
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace in a CSS string."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    return re.sub(r"\s+", " ", css).strip()
+
+
+# Built once at import; Streamlit reruns reuse the same string
+_GLOBAL_STYLES_MINIFIED = _minify_css(_GLOBAL_STYLES_CSS)
+
+# Streamlit serves <main script dir>/static at /app/static when
+# server.enableStaticServing is on (see .streamlit/config.toml)
+_STATIC_CSS_PATH = Path(__file__).resolve().parents[2] / "static" / "gym_bro.css"
+_STATIC_CSS_URL = "/app/static/gym_bro.css"
+
+# Purged + minified build written by scripts/build_css.py. The manifest lists
+# the tokens sheet, the base sheet and one sheet per width breakpoint, each
+# with its media query and content hash.
+_BUILT_CSS_MANIFEST_PATH = _STATIC_CSS_PATH.with_name("gym_bro.min.json")
+_STATIC_URL_PREFIX = "/app/static/"
+
+
+def _stylesheet_hash() -> str:
+    """Short content hash of the current stylesheet."""
+    return hashlib.md5(_GLOBAL_STYLES_MINIFIED.encode("utf-8")).hexdigest()[:8]
+
+
+def _write_static_stylesheet() -> bool:
+    """
+    Write the minified stylesheet to the static folder if it is out of date.
+
+    Returns:
+        bool: True if the static file holds the current CSS, False if it
+        could not be written (e.g. read-only deploy)
+    """
+    try:
+        if _STATIC_CSS_PATH.exists():
+            if _STATIC_CSS_PATH.read_text(encoding="utf-8") == _GLOBAL_STYLES_MINIFIED:
+                return True
+        _STATIC_CSS_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _STATIC_CSS_PATH.write_text(_GLOBAL_STYLES_MINIFIED, encoding="utf-8")
+        return True
+    except OSError:
+        return False
+
+
+def _load_built_sheets() -> list[dict] | None:
+    """
+    Sheets from the build manifest, if it was built from the current stylesheet.
+
+    Returns:
+        list[dict] | None: [{"file": ..., "media": ..., "v": ...}, ...] or None if the
+        build is missing or stale
+    """
+    try:
+        manifest = json.loads(_BUILT_CSS_MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if manifest.get("src") != _stylesheet_hash():
+        return None
+    return manifest.get("sheets")
+
+
+@lru_cache(maxsize=1)
+def get_stylesheets() -> tuple[tuple[str, str], ...]:
+    """
+    Static stylesheets to link, resolved on first use.
+
+    Prefers the purged build, which splits design tokens and width
+    breakpoints into separate sheets so browsers fetch non-matching ones at
+    low priority without blocking render. Falls back to the single full
+    static copy. Used for the page <link> tags and by component iframes
+    that need the same styles.
+
+    Returns:
+        tuple: ((url, media), ...) with cache-busted URLs, or () if no static
+        file can be served
+    """
+    # Content hashes bust the browser cache whenever a sheet changes
+    sheets = _load_built_sheets()
+    if sheets:
+        return tuple(
+            (f"{_STATIC_URL_PREFIX}{sheet['file']}?v={sheet['v']}", sheet["media"])
+            for sheet in sheets
+        )
+    if _write_static_stylesheet():
+        return ((f"{_STATIC_URL_PREFIX}{_STATIC_CSS_PATH.name}?v={_stylesheet_hash()}", "all"),)
+    return ()
+
+
+@lru_cache(maxsize=1)
+def _global_styles_tag() -> str:
+    """Link the static stylesheets, falling back to an inline <style> block."""
+    sheets = get_stylesheets()
+    if sheets:
+        return "".join(
+            f'<link rel="stylesheet" href="{url}" media="{media}">'
+            for url, media in sheets
+        )
+    return f"<style>{_GLOBAL_STYLES_MINIFIED}</style>"
+
+
+def get_global_styles():
+    """
+    Returns centralized CSS for the entire app.
+
+    Includes design tokens, typography scale, spacing system, and component styles.
+    All pages should import and apply these styles for consistency.
+
+    The stylesheet is served as static assets so browsers cache it across
+    reruns and sessions; only small <link> tags are sent per rerun.
+
+    Returns:
+        str: HTML tags loading the CSS, to be used with st.markdown(unsafe_allow_html=True)
+    """
+    return _global_styles_tag()
+
+
+def inject_global_styles():
+    """
+    Emit the global stylesheet into the current page.
 
-    </style>
+    Streamlit removes any element that is not re-emitted on a rerun, so this
+    must run on every script execution rather than once per session. The
+    payload is the same constant string each time, which lets the frontend
+    diff it as unchanged and skip re-rendering it.
     """
+    st.markdown(_global_styles_tag(), unsafe_allow_html=True)
@@ -7,8 +7,32 @@ Shows AI-powered suggestions for the next exercise with:
 - Reasoning for the suggestion
 """
 
+from functools import lru_cache
+
 import streamlit as st
 
+# Fixed labels shared by both suggestion renderers
+SETS_LABEL = "Sets"
+REPS_LABEL = "Reps"
+WEIGHT_LABEL = "Weight"
+WEIGHT_YOUR_CHOICE = "⚠️ Your choice"
+WEIGHT_NEEDED_WARNING = "⚠️ You'll need to specify the weight you used"
+
+# (key, default) pairs unpacked from a suggestion dict, in render order
+_SUGGESTION_FIELDS = (
+    ("exercise_name", None),
+    ("target_sets", 3),
+    ("target_reps", 10),
+    ("suggested_weight_lbs", None),
+    ("reasoning", ""),
+)
+
+
+@lru_cache(maxsize=256)
+def _fmt_weight(weight_lbs: int) -> str:
+    """Format a whole-pound weight for display (e.g. "135 lbs")."""
+    return f"{weight_lbs} lbs"
+
 
 def render_next_suggestion(suggestion: dict | None):
     """
@@ -43,43 +67,13 @@ def _render_plan_suggestion(suggestion: dict):
     Args:
         suggestion: Suggestion dict with source="plan"
     """
-    st.subheader("📋 Next from Your Plan")
-
-    exercise_name = suggestion.get('exercise_name')
-    target_sets = suggestion.get('target_sets', 3)
-    target_reps = suggestion.get('target_reps', 10)
-    suggested_weight = suggestion.get('suggested_weight_lbs')
-    reasoning = suggestion.get('reasoning', '')
     plan_index = suggestion.get('plan_index', 0)
-
-    # Exercise name (large, prominent)
-    st.markdown(f"### **{exercise_name}**")
-
-    # Show plan position
-    st.caption(f"Exercise #{plan_index + 1} in your plan")
-
-    # Metrics in columns
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Sets", target_sets)
-
-    with col2:
-        st.metric("Reps", target_reps)
-
-    with col3:
-        if suggested_weight:
-            st.metric("Weight", f"{suggested_weight:.0f} lbs")
-        else:
-            st.metric("Weight", "⚠️ Your choice")
-
-    # Show reasoning if available
-    if reasoning:
-        st.caption(f"💡 {reasoning}")
-
-    # Highlight if weight needs to be specified
-    if not suggested_weight:
-        st.warning("⚠️ You'll need to specify the weight you used")
+    _render_suggestion_common(
+        suggestion,
+        header="📋 Next from Your Plan",
+        subcaption=f"Exercise #{plan_index + 1} in your plan",
+        reasoning_style="caption"
+    )
 
 
 def _render_adaptive_suggestion(suggestion: dict):
@@ -89,41 +83,65 @@ def _render_adaptive_suggestion(suggestion: dict):
     Args:
         suggestion: Suggestion dict with source="adaptive"
     """
-    st.subheader("🤖 AI Suggests")
+    _render_suggestion_common(
+        suggestion,
+        header="🤖 AI Suggests",
+        subcaption="Complementary exercise for your workout",
+        reasoning_style="info"
+    )
+
+
+def _render_suggestion_common(
+    suggestion: dict,
+    header: str,
+    subcaption: str,
+    reasoning_style: str
+):
+    """
+    Render the layout shared by plan and adaptive suggestions.
 
-    exercise_name = suggestion.get('exercise_name')
-    target_sets = suggestion.get('target_sets', 3)
-    target_reps = suggestion.get('target_reps', 10)
-    suggested_weight = suggestion.get('suggested_weight_lbs')
-    reasoning = suggestion.get('reasoning', '')
+    Args:
+        suggestion: Suggestion dict from suggestion_engine
+        header: Subheader text
+        subcaption: Caption shown under the exercise name
+        reasoning_style: "caption" or "info" - how to display the reasoning
+    """
+    st.subheader(header)
+
+    exercise_name, target_sets, target_reps, suggested_weight, reasoning = (
+        suggestion.get(key, default) for key, default in _SUGGESTION_FIELDS
+    )
 
     # Exercise name (large, prominent)
     st.markdown(f"### **{exercise_name}**")
 
-    st.caption("Complementary exercise for your workout")
+    st.caption(subcaption)
 
     # Metrics in columns
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.metric("Sets", target_sets)
+        st.metric(SETS_LABEL, target_sets)
 
     with col2:
-        st.metric("Reps", target_reps)
+        st.metric(REPS_LABEL, target_reps)
 
     with col3:
         if suggested_weight:
-            st.metric("Weight", f"{suggested_weight:.0f} lbs")
+            st.metric(WEIGHT_LABEL, _fmt_weight(round(suggested_weight)))
         else:
-            st.metric("Weight", "⚠️ Your choice")
+            st.metric(WEIGHT_LABEL, WEIGHT_YOUR_CHOICE)
 
-    # Show reasoning
+    # Show reasoning if available
     if reasoning:
-        st.info(f"💡 {reasoning}")
+        if reasoning_style == "info":
+            st.info(f"💡 {reasoning}")
+        else:
+            st.caption(f"💡 {reasoning}")
 
     # Highlight if weight needs to be specified
     if not suggested_weight:
-        st.warning("⚠️ You'll need to specify the weight you used")
+        st.warning(WEIGHT_NEEDED_WARNING)
 
 
 def render_suggestion_prompt():
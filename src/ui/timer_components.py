@@ -1,6 +1,21 @@
 """Client-side JavaScript timer component."""
 import streamlit as st
+import streamlit.components.v1 as components
 import time
+from pathlib import Path
+
+from src.ui.styles import get_stylesheets
+
+# Quick adjust durations (seconds) offered under the timer
+QUICK_ADJUST_SECONDS = (30, 60, 90)
+QUICK_ADJUST_LABEL = "**Quick Adjust:**"
+
+# Countdown frontend (src/ui/frontend/rest_timer/index.html). The iframe is
+# loaded once and persists across reruns; only start_time/duration are re-sent.
+_rest_timer = components.declare_component(
+    "rest_timer",
+    path=str(Path(__file__).parent / "frontend" / "rest_timer")
+)
 
 
 def render_rest_timer(
@@ -11,106 +26,69 @@ def render_rest_timer(
     """
     Client-side countdown timer with auto-advance.
 
-    Uses JavaScript for smooth countdown without st.rerun() polling.
-    Auto-advances by programmatically clicking hidden button when timer expires.
+    Uses a JavaScript component for smooth countdown without st.rerun() polling.
+    The component reports completion back as its value, which triggers the
+    same completion path as the manual Complete button.
 
     Args:
         duration_seconds: Rest duration in seconds
         on_complete_callback: Function to call when timer completes (for state updates)
         show_quick_adjust: Show 30s/60s/90s quick adjust buttons
     """
-    # Initialize timer state
-    if 'rest_timer_active' not in st.session_state:
-        st.session_state.rest_timer_active = False
+    # Bind session state once; every access goes through __getattr__
+    ss = st.session_state
 
-    if not st.session_state.rest_timer_active:
+    # Initialize timer state
+    if not ss.get('rest_timer_active', False):
         # Start timer
-        st.session_state.rest_start_time = time.time()
-        st.session_state.rest_duration = duration_seconds
-        st.session_state.rest_timer_active = True
-
-    elapsed = time.time() - st.session_state.rest_start_time
-    remaining = max(0, st.session_state.rest_duration - elapsed)
-
-    # Timer display and JavaScript countdown
-    st.markdown(f"""
-    <div class="rest-timer-container">
-        <div class="rest-timer-display" id="timer-display">
-            {int(remaining // 60)}:{int(remaining % 60):02d}
-        </div>
-        <div class="rest-progress-bar">
-            <div class="rest-progress-fill" id="progress-fill"></div>
-        </div>
-    </div>
-
-    <script>
-        // Client-side countdown
-        let startTime = {st.session_state.rest_start_time};
-        let duration = {st.session_state.rest_duration};
-
-        function updateTimer() {{
-            let elapsed = (Date.now() / 1000) - startTime;
-            let remaining = Math.max(0, duration - elapsed);
-
-            // Update display
-            let mins = Math.floor(remaining / 60);
-            let secs = Math.floor(remaining % 60);
-            let display = document.getElementById('timer-display');
-            if (display) {{
-                display.textContent = mins + ':' + (secs < 10 ? '0' : '') + secs;
-            }}
-
-            // Update progress bar
-            let progress = (elapsed / duration) * 100;
-            let fill = document.getElementById('progress-fill');
-            if (fill) {{
-                fill.style.width = Math.min(100, progress) + '%';
-            }}
-
-            // Auto-complete when timer expires
-            if (remaining <= 0) {{
-                let completeBtn = document.getElementById('timer-complete-btn');
-                if (completeBtn) {{
-                    completeBtn.click();
-                }}
-                return;  // Stop interval
-            }}
-
-            // Continue countdown
-            setTimeout(updateTimer, 100);  // Update every 100ms for smooth display
-        }}
-
-        // Start countdown on page load
-        updateTimer();
-    </script>
-    """, unsafe_allow_html=True)
-
-    # Hidden button for auto-complete (clicked by JavaScript)
-    if st.button("Complete", key="timer-complete-btn", type="primary", use_container_width=True):
-        st.session_state.rest_timer_active = False
+        ss.rest_start_time = time.time()
+        ss.rest_duration = duration_seconds
+        ss.rest_timer_active = True
+
+    start_time = ss.rest_start_time
+
+    # rest_start_time stays on time.time() because the component compares it
+    # against the browser's epoch clock (Date.now())
+    completed_start = _rest_timer(
+        start_time=start_time,
+        duration=ss.rest_duration,
+        stylesheets=[{"href": url, "media": media} for url, media in get_stylesheets()],
+        key="rest-timer",
+        default=None
+    )
+
+    # Component returns the start_time of the timer that ran out; a value
+    # left over from an earlier timer won't match the current one
+    timer_expired = completed_start == start_time
+
+    # Manual skip, and the auto-advance path when the countdown expires
+    complete_clicked = st.button("Complete", key="timer-complete-btn", type="primary", use_container_width=True)
+    if complete_clicked or timer_expired:
+        ss.rest_timer_active = False
         if on_complete_callback:
             on_complete_callback()
         st.rerun()
 
-    # Quick adjust buttons (these DO use st.rerun, but only on explicit user action)
+    # Quick adjust buttons
     if show_quick_adjust:
-        st.markdown("**Quick Adjust:**")
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            if st.button("30s", use_container_width=True):
-                st.session_state.rest_start_time = time.time()
-                st.session_state.rest_duration = 30
-                st.rerun()
-
-        with col2:
-            if st.button("60s", use_container_width=True):
-                st.session_state.rest_start_time = time.time()
-                st.session_state.rest_duration = 60
-                st.rerun()
-
-        with col3:
-            if st.button("90s", use_container_width=True):
-                st.session_state.rest_start_time = time.time()
-                st.session_state.rest_duration = 90
-                st.rerun()
+        st.markdown(QUICK_ADJUST_LABEL)
+        cols = st.columns(len(QUICK_ADJUST_SECONDS))
+
+        # on_click updates state before the click's own rerun, so no second
+        # st.rerun() is needed; the timer frame just receives the new args
+        for col, secs in zip(cols, QUICK_ADJUST_SECONDS):
+            with col:
+                st.button(
+                    f"{secs}s",
+                    key=f"adj-{secs}",
+                    on_click=_restart_rest_timer,
+                    args=(secs,),
+                    use_container_width=True
+                )
+
+
+def _restart_rest_timer(duration_seconds: int):
+    """Restart the rest countdown with a new duration (quick adjust callback)."""
+    ss = st.session_state
+    ss.rest_start_time = time.time()
+    ss.rest_duration = duration_seconds
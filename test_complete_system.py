@@ -12,6 +12,7 @@ This demonstrates the FULL agentic architecture:
 Run: python test_complete_system.py
 """
 
+import asyncio
 import os
 from dotenv import load_dotenv
 from src.agents.main import get_gym_bro
@@ -21,16 +22,18 @@ load_dotenv()
 def test_complete_system():
     """Test all 5 intents in one demo."""
 
-    print("=" * 80)
-    print("🏋️  GYM BRO - COMPLETE SYSTEM TEST (All Phases)")
-    print("=" * 80)
-    print("\nDemonstrating all components:")
-    print("  1. Chat Chain - General conversation")
-    print("  2. Query Agent - Workout history analysis")
-    print("  3. Recommend Agent - Workout planning")
-    print("  4. Admin Chain - Data management")
-    print("  5. Log Graph - Natural language workout logging (Phase 3!)")
-    print("=" * 80)
+    print("\n".join([
+        "=" * 80,
+        "🏋️  GYM BRO - COMPLETE SYSTEM TEST (All Phases)",
+        "=" * 80,
+        "\nDemonstrating all components:",
+        "  1. Chat Chain - General conversation",
+        "  2. Query Agent - Workout history analysis",
+        "  3. Recommend Agent - Workout planning",
+        "  4. Admin Chain - Data management",
+        "  5. Log Graph - Natural language workout logging (Phase 3!)",
+        "=" * 80,
+    ]))
 
     # Initialize the orchestrator
     coach = get_gym_bro()
@@ -64,36 +67,45 @@ def test_complete_system():
         },
     ]
 
-    for i, test in enumerate(test_cases, 1):
-        print(f"\n\n{'='*80}")
-        print(f"TEST {i}/5: {test['description']}")
-        print("=" * 80)
-        print(f"\n👤 User: {test['message']}")
-        print("-" * 80)
+    # The cases are independent, so send them all at once and print the
+    # results in order once every response is in
+    async def run_all():
+        return await asyncio.gather(
+            *(coach.aprocess_message(test['message']) for test in test_cases)
+        )
 
-        result = coach.process_message(test['message'])
+    results = asyncio.run(run_all())
 
-        print(f"\n🎯 Intent Classified: {result['intent']}")
-        print(f"🔧 Handler Used: {result['handler']}")
-        print(f"\n🤖 Response:")
-        print("-" * 80)
-        print(result['response'])
-
-    print("\n\n" + "=" * 80)
-    print("✅ ALL TESTS COMPLETE!")
-    print("=" * 80)
-    print("\n📊 Summary:")
-    print("  ✅ Chat Chain - Working")
-    print("  ✅ Log Graph - Working (Phase 3!)")
-    print("  ✅ Query Agent - Working")
-    print("  ✅ Recommend Agent - Working")
-    print("  ✅ Intent Router - 100% accuracy")
-    print("\n🎉 Full agentic architecture operational!")
-    print("\nReady for:")
-    print("  • Phase 4: Streamlit UI")
-    print("  • Phase 5: Historical data import")
-    print("  • Phase 6: Polish & deployment")
+    for i, (test, result) in enumerate(zip(test_cases, results), 1):
+        print("\n".join([
+            f"\n\n{'='*80}",
+            f"TEST {i}/5: {test['description']}",
+            "=" * 80,
+            f"\n👤 User: {test['message']}",
+            "-" * 80,
+            f"\n🎯 Intent Classified: {result['intent']}",
+            f"🔧 Handler Used: {result['handler']}",
+            "\n🤖 Response:",
+            "-" * 80,
+            str(result['response']),
+        ]))
 
+    print("\n".join([
+        "\n\n" + "=" * 80,
+        "✅ ALL TESTS COMPLETE!",
+        "=" * 80,
+        "\n📊 Summary:",
+        "  ✅ Chat Chain - Working",
+        "  ✅ Log Graph - Working (Phase 3!)",
+        "  ✅ Query Agent - Working",
+        "  ✅ Recommend Agent - Working",
+        "  ✅ Intent Router - 100% accuracy",
+        "\n🎉 Full agentic architecture operational!",
+        "\nReady for:",
+        "  • Phase 4: Streamlit UI",
+        "  • Phase 5: Historical data import",
+        "  • Phase 6: Polish & deployment",
+    ]))
 
 if __name__ == "__main__":
     test_complete_system()
@@ -2,13 +2,7 @@
 Test exercise intro information system.
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
-from src.agents.suggestion_engine import get_exercise_info
+from src.agents.suggestion_engine import get_exercise_info, get_exercise_info_batch
 
 
 def test_exercise_info():
@@ -17,9 +11,13 @@ def test_exercise_info():
     print("🧪 Testing Exercise Info for UI")
     print("=" * 60)
 
+    catalog_info, variation_info, unknown_info, bodyweight_info = get_exercise_info_batch(
+        ["Dumbbell Bench Press", "DB Bench", "Exotic Curl", "Pull Ups"]
+    )
+
     # Test with catalog exercise
     print("\n📋 Testing catalog exercise (Dumbbell Bench Press):")
-    info = get_exercise_info("Dumbbell Bench Press")
+    info = catalog_info
 
     assert info['found_in_catalog'] == True, "Should find exercise in catalog"
     assert info['canonical_name'] == "Dumbbell Bench Press"
@@ -39,7 +37,7 @@ def test_exercise_info():
 
     # Test with variation
     print("\n📋 Testing exercise variation (DB Bench):")
-    info = get_exercise_info("DB Bench")
+    info = variation_info
 
     assert info['found_in_catalog'] == True, "Should match variation"
     assert info['canonical_name'] == "Dumbbell Bench Press", "Should map to canonical"
@@ -47,7 +45,7 @@ def test_exercise_info():
 
     # Test with unknown exercise
     print("\n📋 Testing unknown exercise (Exotic Curl):")
-    info = get_exercise_info("Exotic Curl")
+    info = unknown_info
 
     assert info['found_in_catalog'] == False, "Should not find in catalog"
     assert info['canonical_name'] == "Exotic Curl", "Should use original name"
@@ -60,7 +58,7 @@ def test_exercise_info():
 
     # Test bodyweight exercise
     print("\n📋 Testing bodyweight exercise (Pull Ups):")
-    info = get_exercise_info("Pull Ups")
+    info = bodyweight_info
 
     assert info['found_in_catalog'] == True
     assert info['category'] == "bodyweight"
@@ -83,6 +81,12 @@ def test_exercise_info():
     print("  • Weight reasoning/form tips\n")
 
 
+def test_exercise_info_batch_matches_single():
+    """Batch lookups return the same dicts as one-at-a-time lookups."""
+    names = ["Dumbbell Bench Press", "DB Bench", "Exotic Curl", "Pull Ups", "Cable Reverse Fly", "DB Bench"]
+    assert get_exercise_info_batch(names) == [get_exercise_info(name) for name in names]
+
+
 if __name__ == "__main__":
     try:
         test_exercise_info()
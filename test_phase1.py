@@ -3,13 +3,9 @@ Integration tests for Phase 1 components.
 Tests models, data layer, router, and tools without requiring LLM calls.
 """
 
-import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from datetime import date, timedelta
+
+import pytest
 from src.models import WorkoutLog, Exercise, Set, WorkoutTemplate, WeeklySplit
 from src.data import (
     get_all_logs,
@@ -43,55 +39,57 @@ def test_models():
 
 def test_data_layer():
     """Test JSON data layer operations."""
-    print("\n🧪 Testing data layer...")
+    out = ["\n🧪 Testing data layer..."]
 
     # Test loading logs
     logs = get_all_logs()
     assert isinstance(logs, list), "get_all_logs should return a list"
-    print(f"  ✅ Loaded {len(logs)} workout logs")
+    out.append(f"  ✅ Loaded {len(logs)} workout logs")
 
     # Test date range filtering
     end = date.today()
     start = end - timedelta(days=30)
     recent_logs = get_logs_by_date_range(start, end)
-    print(f"  ✅ Found {len(recent_logs)} logs in last 30 days")
+    out.append(f"  ✅ Found {len(recent_logs)} logs in last 30 days")
 
     # Test template loading
     push_template = get_template("push")
     if push_template:
-        print(f"  ✅ Loaded template: {push_template.get('name')}")
+        out.append(f"  ✅ Loaded template: {push_template.get('name')}")
     else:
-        print("  ⚠️  No push template found (this is okay for now)")
+        out.append("  ⚠️  No push template found (this is okay for now)")
 
     # Test weekly split
     split = get_weekly_split()
     assert "config" in split, "Weekly split should have config"
     assert "current_week" in split, "Weekly split should have current_week"
-    print(f"  ✅ Weekly split loaded: {split['current_week'].get('next_in_rotation')} is next")
+    out.append(f"  ✅ Weekly split loaded: {split['current_week'].get('next_in_rotation')} is next")
 
+    print("\n".join(out))
 
-def test_router():
-    """Test intent classification with quick patterns."""
-    print("\n🧪 Testing router (quick patterns only)...")
 
-    test_cases = [
-        ("Just did push day", "log"),
-        ("What did I bench last time?", "query"),
-        ("What should I do today?", "recommend"),
-        ("Fix my last workout", "admin"),
-    ]
+ROUTER_CASES = [
+    ("Just did push day", "log"),
+    ("What did I bench last time?", "query"),
+    ("What should I do today?", "recommend"),
+    ("Fix my last workout", "admin"),
+]
 
-    for user_input, expected in test_cases:
-        result = quick_route(user_input)
-        if result == expected:
-            print(f"  ✅ '{user_input[:30]}...' → {result}")
-        else:
-            print(f"  ⚠️  '{user_input[:30]}...' → {result} (expected {expected})")
+
+@pytest.mark.parametrize("user_input,expected", ROUTER_CASES)
+def test_router(user_input, expected):
+    """Test intent classification with quick patterns.
+
+    quick_route may defer (return None) to the full classifier, but must
+    never pick the wrong intent.
+    """
+    result = quick_route(user_input)
+    assert result in (expected, None), f"'{user_input}' → {result} (expected {expected})"
 
 
 def test_query_tools():
     """Test query tools with sample data."""
-    print("\n🧪 Testing query tools...")
+    out = ["\n🧪 Testing query tools..."]
 
     from src.tools.query_tools import search_workouts, get_workout_count
 
@@ -99,55 +97,61 @@ def test_query_tools():
     try:
         # Search for bench press
         results = search_workouts.invoke({"query": "bench", "days": 30})
-        print(f"  ✅ search_workouts found {len(results)} results for 'bench'")
+        out.append(f"  ✅ search_workouts found {len(results)} results for 'bench'")
     except Exception as e:
-        print(f"  ⚠️  search_workouts error: {e}")
+        out.append(f"  ⚠️  search_workouts error: {e}")
 
     try:
         # Count workouts
         count_result = get_workout_count.invoke({"days": 30})
-        print(f"  ✅ get_workout_count: {count_result.get('total')} workouts in last 30 days")
+        out.append(f"  ✅ get_workout_count: {count_result.get('total')} workouts in last 30 days")
     except Exception as e:
-        print(f"  ⚠️  get_workout_count error: {e}")
+        out.append(f"  ⚠️  get_workout_count error: {e}")
+
+    print("\n".join(out))
 
 
 def test_recommend_tools():
     """Test recommendation tools."""
-    print("\n🧪 Testing recommend tools...")
+    out = ["\n🧪 Testing recommend tools..."]
 
     from src.tools.recommend_tools import get_weekly_split_status, suggest_next_workout
 
     try:
         # Get weekly status
         status = get_weekly_split_status.invoke({})
-        print(f"  ✅ Weekly split status: {status.get('summary')}")
-        print(f"     Next suggested: {status.get('next_suggested')}")
+        out.append(f"  ✅ Weekly split status: {status.get('summary')}")
+        out.append(f"     Next suggested: {status.get('next_suggested')}")
     except Exception as e:
-        print(f"  ⚠️  get_weekly_split_status error: {e}")
+        out.append(f"  ⚠️  get_weekly_split_status error: {e}")
 
     try:
         # Get suggestion
         suggestion = suggest_next_workout.invoke({})
-        print(f"  ✅ Workout suggestion: {suggestion.get('suggested_type')}")
-        print(f"     Reason: {suggestion.get('reason')}")
+        out.append(f"  ✅ Workout suggestion: {suggestion.get('suggested_type')}")
+        out.append(f"     Reason: {suggestion.get('reason')}")
     except Exception as e:
-        print(f"  ⚠️  suggest_next_workout error: {e}")
+        out.append(f"  ⚠️  suggest_next_workout error: {e}")
+
+    print("\n".join(out))
 
 
 def test_exercise_history():
     """Test exercise history retrieval."""
-    print("\n🧪 Testing exercise history...")
+    out = ["\n🧪 Testing exercise history..."]
 
     try:
         history = get_exercise_history("bench", days=90)
         if history:
-            print(f"  ✅ Found {len(history)} bench press sessions")
+            out.append(f"  ✅ Found {len(history)} bench press sessions")
             latest = history[-1]
-            print(f"     Latest: {latest.get('date')} - {latest.get('max_weight')} lbs")
+            out.append(f"     Latest: {latest.get('date')} - {latest.get('max_weight')} lbs")
         else:
-            print("  ⚠️  No bench press history found (might be expected)")
+            out.append("  ⚠️  No bench press history found (might be expected)")
     except Exception as e:
-        print(f"  ⚠️  get_exercise_history error: {e}")
+        out.append(f"  ⚠️  get_exercise_history error: {e}")
+
+    print("\n".join(out))
 
 
 def main():
@@ -159,22 +163,27 @@ def main():
     try:
         test_models()
         test_data_layer()
-        test_router()
+        print("\n🧪 Testing router (quick patterns only)...")
+        for user_input, expected in ROUTER_CASES:
+            test_router(user_input, expected)
+            print(f"  ✅ '{user_input[:30]}...' → {quick_route(user_input) or 'full classifier'}")
         test_query_tools()
         test_recommend_tools()
         test_exercise_history()
 
-        print("\n" + "=" * 60)
-        print("✅ ALL PHASE 1 TESTS PASSED!")
-        print("=" * 60)
-        print("\n📋 Summary:")
-        print("  • Pydantic models: Working")
-        print("  • Data layer (JSON): Working")
-        print("  • Intent router: Working")
-        print("  • Query tools: Working")
-        print("  • Recommend tools: Working")
-        print("\n🎯 Phase 1 is COMPLETE and VALIDATED!")
-        print("   Ready to proceed to Phase 2: Agents & Chains\n")
+        print("\n".join([
+            "\n" + "=" * 60,
+            "✅ ALL PHASE 1 TESTS PASSED!",
+            "=" * 60,
+            "\n📋 Summary:",
+            "  • Pydantic models: Working",
+            "  • Data layer (JSON): Working",
+            "  • Intent router: Working",
+            "  • Query tools: Working",
+            "  • Recommend tools: Working",
+            "\n🎯 Phase 1 is COMPLETE and VALIDATED!",
+            "   Ready to proceed to Phase 2: Agents & Chains\n",
+        ]))
 
         return 0
 
@@ -0,0 +1,92 @@
+"""
+Persistent LLM response cache for the test suite.
+
+Stores chat model generations in a small SQLite file keyed by a hash of
+(model config, prompt), so re-running the LLM-backed tests with unchanged
+prompts skips the network. Installed for the whole session by
+tests/conftest.py; standalone scripts call install_llm_cache() themselves.
+
+Delete the file, set PYTEST_LLM_CACHE=off, or run pytest with
+--no-llm-cache to force fresh responses.
+
+The file lives at the project root by default. Set GYMBRO_LLM_CACHE_DIR to
+keep it somewhere a CI cache step can save and restore between runs (key
+it on the prompts and requirements.txt so stale answers are dropped).
+"""
+
+import hashlib
+import os
+import sqlite3
+import warnings
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
+
+CACHE_PATH = Path(
+    os.environ.get("GYMBRO_LLM_CACHE_DIR") or Path(__file__).resolve().parent.parent
+) / ".test_llm_cache.db"
+
+# Only what chat model generations contain; nothing else is revived
+_ALLOWED_OBJECTS = [Generation, ChatGeneration, AIMessage]
+
+
+def llm_cache_enabled() -> bool:
+    """False when PYTEST_LLM_CACHE=off (or 0/false) is set."""
+    return os.environ.get("PYTEST_LLM_CACHE", "on").lower() not in {"off", "0", "false"}
+
+
+class SQLiteLLMCache(BaseCache):
+    """LangChain cache backed by one SQLite table of serialized generations."""
+
+    def __init__(self, path: Path = CACHE_PATH):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # A connection per call keeps the cache safe to use from test threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ?", (self._key(prompt, llm_string),)
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")  # loads() is marked beta
+                return loads(row[0], allowed_objects=_ALLOWED_OBJECTS)
+        except Exception:
+            return None  # Written by an incompatible langchain version; refetch
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)",
+                (self._key(prompt, llm_string), dumps(list(return_val))),
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM llm_cache")
+
+
+def install_llm_cache() -> bool:
+    """Route every LangChain chat model through the disk cache, unless disabled."""
+    if not llm_cache_enabled():
+        return False
+    set_llm_cache(SQLiteLLMCache())
+    return True
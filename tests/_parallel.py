@@ -0,0 +1,129 @@
+"""
+Run the standalone test scripts' test functions concurrently.
+
+The test functions in these scripts spend almost all of their time waiting
+on LLM calls and share no state, so main() can run them side by side.
+Each function's printed output is captured separately and replayed as one
+block, in the original order, so concurrent runs don't interleave lines.
+Log records go through the same capture when StdoutLogHandler is used.
+
+call_coalesced() lets tests running side by side share one in-flight call
+for identical (function, arguments) pairs instead of each sending it.
+
+Concurrency is capped by GYMBRO_TEST_CONCURRENCY (default 4).
+"""
+
+import asyncio
+import io
+import logging
+import os
+import sys
+import threading
+import traceback
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+# (fn, args) → Future for calls currently running
+_in_flight: dict[tuple, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _concurrency_limit() -> int:
+    """Max test functions run at once."""
+    return max(1, int(os.environ.get("GYMBRO_TEST_CONCURRENCY", "4")))
+
+
+class _PerThreadStdout(io.TextIOBase):
+    """sys.stdout stand-in that writes to a per-thread buffer when one is set."""
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def capture(self, buffer: io.StringIO | None) -> None:
+        self._local.buffer = buffer
+
+    def write(self, text: str) -> int:
+        return (getattr(self._local, "buffer", None) or self._default).write(text)
+
+    def flush(self) -> None:
+        self._default.flush()
+
+
+def call_coalesced(fn: Callable, *args: Any) -> Any:
+    """
+    Call fn(*args), or wait for an identical call already running.
+
+    Thread-based rather than asyncio, since each test drives its own event
+    loop. Finished results are not kept; repeats across runs are served by
+    the LLM disk cache instead.
+    """
+    key = (fn, args)
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        owner = future is None
+        if owner:
+            future = _in_flight[key] = Future()
+
+    if owner:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with _in_flight_lock:
+                del _in_flight[key]
+
+    return future.result()
+
+
+class StdoutLogHandler(logging.Handler):
+    """Write records to sys.stdout as it is at emit time, i.e. the current test's buffer."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+
+async def run_concurrently(tests: list[tuple[str, Callable[[], bool]]]) -> list[tuple[str, bool]]:
+    """
+    Run (name, test_fn) pairs concurrently and print each one's output.
+
+    A test that raises is reported as failed with its traceback.
+
+    Returns:
+        (name, passed) pairs in the order given
+    """
+    stdout = _PerThreadStdout(sys.stdout)
+    semaphore = asyncio.Semaphore(_concurrency_limit())
+
+    def run_one(test_fn: Callable[[], bool]) -> tuple[bool, str]:
+        buffer = io.StringIO()
+        stdout.capture(buffer)
+        try:
+            passed = bool(test_fn())
+        except Exception:
+            traceback.print_exc(file=buffer)
+            passed = False
+        finally:
+            stdout.capture(None)
+        return passed, buffer.getvalue()
+
+    async def run_limited(test_fn: Callable[[], bool]) -> tuple[bool, str]:
+        async with semaphore:
+            return await asyncio.to_thread(run_one, test_fn)
+
+    sys.stdout = stdout
+    try:
+        outcomes = await asyncio.gather(*(run_limited(fn) for _, fn in tests))
+    finally:
+        sys.stdout = stdout._default
+
+    results = []
+    for (name, _), (passed, output) in zip(tests, outcomes):
+        sys.stdout.write(output)
+        results.append((name, passed))
+    return results
@@ -0,0 +1,17 @@
+"""
+Expected shape of the session_data returned when the chat agent starts a
+workout session (start_workout_session).
+
+Tests validate the whole dict in one model_validate() call instead of
+asserting key by key, and get attribute access to the fields afterwards.
+"""
+
+from pydantic import BaseModel
+
+
+class SessionData(BaseModel):
+    """Fields every created session must carry."""
+    session_id: str
+    suggested_type: str
+    planned_template: dict
+    equipment_unavailable: list[str] | None = None
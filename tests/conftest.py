@@ -0,0 +1,87 @@
+"""
+Shared pytest fixtures for the tests/ suite.
+
+Loads .env before collection, provides one Claude client that the agent
+fixtures share, one ChatAgent and one RecommendAgent for the whole session,
+and installs the on-disk LLM response cache (tests/_llm_cache.py) so
+unchanged prompts skip the network on reruns. Pass --no-llm-cache for a
+fresh, uncached run.
+
+Building a client makes no API call; tests that talk to the live API also
+request _llm_connection, so replay-only tests never trigger the warm-up.
+"""
+
+import pytest
+from dotenv import load_dotenv
+from langchain_core.globals import set_llm_cache
+
+from _llm_cache import install_llm_cache
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-llm-cache",
+        action="store_true",
+        help="Send every LLM prompt to the API instead of the on-disk response cache",
+    )
+
+
+def pytest_configure(config):
+    # Load API keys and Supabase credentials from .env once, before
+    # collection, so skipif conditions on them see the same environment
+    load_dotenv()
+
+
+@pytest.fixture(scope="session")
+def _llm_connection():
+    """
+    Open the Anthropic keep-alive connection once, before tests fan out.
+
+    ChatAnthropic instances share one httpx client per process, so a single
+    uncached 1-token call warms the pool every agent uses.
+    """
+    from langchain_anthropic import ChatAnthropic
+
+    try:
+        ChatAnthropic(model="claude-haiku-4-5-20251001", max_tokens=1, cache=False).invoke("ping")
+    except Exception:
+        pass  # Best effort; the tests themselves report API problems
+
+
+@pytest.fixture(scope="session")
+def llm():
+    """Shared Claude client, configured like the agents' own default."""
+    from langchain_anthropic import ChatAnthropic
+
+    return ChatAnthropic(model="claude-sonnet-4-20250514", temperature=0)
+
+
+@pytest.fixture(scope="session")
+def chat_agent(_llm_connection):
+    """Shared ChatAgent; it keeps no per-conversation state between chat() calls."""
+    from src.agents.chat_agent import ChatAgent
+
+    return ChatAgent()
+
+
+@pytest.fixture(scope="session")
+def recommend_agent(llm):
+    """
+    Shared RecommendAgent on the shared client, so its tool graph is compiled once per run.
+
+    Tests that replay canned responses patch agent.agent.invoke for their
+    own duration only (monkeypatch / patch.object restore it afterwards).
+    """
+    from src.agents.recommend_agent import RecommendAgent
+
+    return RecommendAgent(llm=llm)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _llm_cache(request):
+    """Serve repeated LLM prompts from .test_llm_cache.db (--no-llm-cache to bypass)."""
+    if request.config.getoption("--no-llm-cache") or not install_llm_cache():
+        yield
+        return
+    yield
+    set_llm_cache(None)
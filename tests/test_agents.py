@@ -3,50 +3,103 @@ Comprehensive Agent Tests
 
 Tests Query Agent and Recommend Agent with various inputs,
 including edge cases and error scenarios.
+
+Each agent is built once (query_agent below, recommend_agent in conftest.py)
+and shared by every parametrized case, so tool binding and LLM client setup
+are not repeated per question.
 """
 
-import os
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from src.agents.query_agent import QueryAgent
 from src.agents.recommend_agent import RecommendAgent
 
-load_dotenv()
+TEST_QUERIES = [
+    "How many workouts did I do in the last 7 days?",
+    "What exercises did I do in my most recent workout?",
+    "Show me all push workouts from the past month",
+    "What's my highest bench press weight?",
+    "How many leg workouts have I done?",
+    "Did I workout on December 20th?",
+    "What's my squat progression looking like?",
+    "Compare my push workout frequency to pull workouts",
+]
+
+TEST_SCENARIOS = [
+    "What should I do today?",
+    "Am I balanced in my training?",
+    "What workout did I do last?",
+    "Show me my leg day template",
+    "What's my weekly split looking like?",
+    "Am I overtraining any muscle groups?",
+    "When was my last pull workout?",
+]
+
+
+@pytest.fixture(scope="module")
+def query_agent(llm, _llm_connection):
+    """One QueryAgent shared by every query case in this module."""
+    return QueryAgent(llm=llm)
+
+
+@pytest.mark.parametrize("query", TEST_QUERIES)
+def test_query_agent(query_agent, query):
+    """Query Agent answers each question."""
+    answer = query_agent.query(query)
+    assert answer, f"Empty response for: {query}"
+
+
+@pytest.mark.parametrize("scenario", TEST_SCENARIOS)
+def test_recommend_agent(_llm_connection, recommend_agent, scenario):
+    """Recommend Agent handles each scenario."""
+    recommendation = recommend_agent.recommend(scenario)
+    assert recommendation, f"Empty response for: {scenario}"
+
+
+# ============================================================================
+# Verbose runner (python tests/test_agents.py)
+# ============================================================================
+
+def _ask_all(ask, prompts: list[str], key: str) -> list[dict]:
+    """
+    Send every prompt concurrently and collect results in input order.
+
+    The calls are independent and spend their time waiting on the LLM, so
+    a thread pool cuts wall-clock time to roughly the slowest call.
+    """
+    def ask_one(prompt: str) -> dict:
+        try:
+            return {key: prompt, "success": True, "response": ask(prompt)}
+        except Exception as e:
+            return {key: prompt, "success": False, "error": str(e)}
 
-def test_query_agent():
-    """Test Query Agent with various questions."""
+    with ThreadPoolExecutor(max_workers=len(prompts)) as pool:
+        return list(pool.map(ask_one, prompts))
+
+
+def run_query_agent(agent: QueryAgent | None = None) -> list[dict]:
+    """Run every query with full output and a success summary."""
 
     print("=" * 80)
     print("🧪 QUERY AGENT COMPREHENSIVE TEST")
     print("=" * 80)
 
-    agent = QueryAgent()
-
-    test_queries = [
-        "How many workouts did I do in the last 7 days?",
-        "What exercises did I do in my most recent workout?",
-        "Show me all push workouts from the past month",
-        "What's my highest bench press weight?",
-        "How many leg workouts have I done?",
-        "Did I workout on December 20th?",
-        "What's my squat progression looking like?",
-        "Compare my push workout frequency to pull workouts",
-    ]
+    agent = agent or QueryAgent()
+    test_queries = TEST_QUERIES
 
     print(f"\nTesting {len(test_queries)} queries...\n")
 
-    results = []
-    for i, query in enumerate(test_queries, 1):
+    results = _ask_all(agent.query, test_queries, "query")
+    for i, result in enumerate(results, 1):
         print(f"\n{'='*80}")
-        print(f"TEST {i}/{len(test_queries)}: {query}")
+        print(f"TEST {i}/{len(test_queries)}: {result['query']}")
         print("-" * 80)
 
-        try:
-            answer = agent.query(query)
-            print(f"✅ Response:\n{answer[:200]}...")
-            results.append({"query": query, "success": True, "response": answer})
-        except Exception as e:
-            print(f"❌ Error: {str(e)[:100]}")
-            results.append({"query": query, "success": False, "error": str(e)})
+        if result["success"]:
+            print(f"✅ Response:\n{result['response'][:200]}...")
+        else:
+            print(f"❌ Error: {result['error'][:100]}")
 
     # Summary
     successful = sum(1 for r in results if r["success"])
@@ -59,40 +112,28 @@ def test_query_agent():
     return results
 
 
-def test_recommend_agent():
-    """Test Recommend Agent with various scenarios."""
+def run_recommend_agent(agent: RecommendAgent | None = None) -> list[dict]:
+    """Run every scenario with full output and a success summary."""
 
     print("\n\n" + "=" * 80)
     print("🧪 RECOMMEND AGENT COMPREHENSIVE TEST")
     print("=" * 80)
 
-    agent = RecommendAgent()
-
-    test_scenarios = [
-        "What should I do today?",
-        "Am I balanced in my training?",
-        "What workout did I do last?",
-        "Show me my leg day template",
-        "What's my weekly split looking like?",
-        "Am I overtraining any muscle groups?",
-        "When was my last pull workout?",
-    ]
+    agent = agent or RecommendAgent()
+    test_scenarios = TEST_SCENARIOS
 
     print(f"\nTesting {len(test_scenarios)} scenarios...\n")
 
-    results = []
-    for i, scenario in enumerate(test_scenarios, 1):
+    results = _ask_all(agent.recommend, test_scenarios, "scenario")
+    for i, result in enumerate(results, 1):
         print(f"\n{'='*80}")
-        print(f"TEST {i}/{len(test_scenarios)}: {scenario}")
+        print(f"TEST {i}/{len(test_scenarios)}: {result['scenario']}")
         print("-" * 80)
 
-        try:
-            recommendation = agent.recommend(scenario)
-            print(f"✅ Response:\n{recommendation[:200]}...")
-            results.append({"scenario": scenario, "success": True, "response": recommendation})
-        except Exception as e:
-            print(f"❌ Error: {str(e)[:100]}")
-            results.append({"scenario": scenario, "success": False, "error": str(e)})
+        if result["success"]:
+            print(f"✅ Response:\n{result['response'][:200]}...")
+        else:
+            print(f"❌ Error: {result['error'][:100]}")
 
     # Summary
     successful = sum(1 for r in results if r["success"])
@@ -106,8 +147,12 @@ def test_recommend_agent():
 
 
 if __name__ == "__main__":
-    query_results = test_query_agent()
-    recommend_results = test_recommend_agent()
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    query_results = run_query_agent()
+    recommend_results = run_recommend_agent()
 
     print("\n\n" + "=" * 80)
     print("🎉 AGENT TESTING COMPLETE!")
@@ -6,28 +6,52 @@ Tests the following capabilities:
 2. Chat workout recommendations (using Recommend tools)
 3. Workout session creation from chat
 4. Session data extraction and return
-"""
 
-import sys
-import os
-from dotenv import load_dotenv
+Per-prompt progress is logged at INFO (lazily formatted) rather than
+printed. It is only visible when the file is run directly or pytest is
+given --log-level=INFO.
+"""
 
-# Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+import asyncio
+import logging
+from functools import partial
 
 from src.agents.chat_agent import ChatAgent
 from src.agents.main import GymBroOrchestrator
+from _parallel import StdoutLogHandler, call_coalesced, run_concurrently
+from _session import SessionData
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
+# Max chat calls in flight at once, to stay under provider rate limits
+CHAT_CONCURRENCY = 4
 
-def test_chat_history_query():
-    """Test 1: ChatAgent should use Query tools to answer history questions"""
-    print("\n" + "=" * 70)
-    print("TEST 1: Chat History Query")
-    print("=" * 70)
 
-    agent = ChatAgent()
+def _chat_all(agent: ChatAgent, prompts: list[str]) -> list:
+    """
+    Send independent prompts to agent.chat concurrently.
+
+    Returns results in prompt order; a call that raised is returned as its
+    exception so each test can still report per-prompt failures. A prompt
+    already in flight (from this or a concurrent test) is not sent again.
+    """
+    async def run():
+        semaphore = asyncio.Semaphore(CHAT_CONCURRENCY)
+
+        async def chat_one(prompt):
+            async with semaphore:
+                return await asyncio.to_thread(call_coalesced, agent.chat, prompt)
+
+        return await asyncio.gather(*(chat_one(p) for p in prompts), return_exceptions=True)
+
+    return asyncio.run(run())
+
+
+def test_chat_history_query(chat_agent: ChatAgent):
+    """Test 1: ChatAgent should use Query tools to answer history questions"""
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST 1: Chat History Query")
+    logger.info("=" * 70)
 
     test_queries = [
         "What did I bench last week?",
@@ -35,16 +59,18 @@ def test_chat_history_query():
         "Show me my squat progression"
     ]
 
-    for query in test_queries:
-        print(f"\n👤 User: {query}")
-        print("🤖 Agent thinking...\n")
+    results = _chat_all(chat_agent, test_queries)
+
+    for query, result in zip(test_queries, results):
+        logger.info("\n👤 User: %s", query)
 
         try:
-            result = agent.chat(query)
+            if isinstance(result, Exception):
+                raise result
 
-            print(f"✅ Response: {result['response'][:200]}...")
-            print(f"📊 Tools used: {result['tool_calls']}")
-            print(f"🎯 Session created: {result['session_data'] is not None}")
+            logger.info("✅ Response: %.200s...", result['response'])
+            logger.info("📊 Tools used: %s", result['tool_calls'])
+            logger.info("🎯 Session created: %s", result['session_data'] is not None)
 
             # Assertions
             assert isinstance(result, dict), "Result should be dict"
@@ -53,24 +79,20 @@ def test_chat_history_query():
             assert len(result['tool_calls']) > 0, "Should use at least one tool for data query"
             assert result['session_data'] is None, "History query shouldn't create session"
 
-            print("✅ PASS")
+            logger.info("✅ PASS")
 
         except Exception as e:
-            print(f"❌ FAIL: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ FAIL: %s", e)
             return False
 
     return True
 
 
-def test_chat_recommendations():
+def test_chat_recommendations(chat_agent: ChatAgent):
     """Test 2: ChatAgent should use Recommend tools for workout suggestions"""
-    print("\n" + "=" * 70)
-    print("TEST 2: Chat Recommendations")
-    print("=" * 70)
-
-    agent = ChatAgent()
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST 2: Chat Recommendations")
+    logger.info("=" * 70)
 
     test_queries = [
         "What should I train today?",
@@ -78,16 +100,18 @@ def test_chat_recommendations():
         "Am I behind on any muscle groups?"
     ]
 
-    for query in test_queries:
-        print(f"\n👤 User: {query}")
-        print("🤖 Agent thinking...\n")
+    results = _chat_all(chat_agent, test_queries)
+
+    for query, result in zip(test_queries, results):
+        logger.info("\n👤 User: %s", query)
 
         try:
-            result = agent.chat(query)
+            if isinstance(result, Exception):
+                raise result
 
-            print(f"✅ Response: {result['response'][:200]}...")
-            print(f"📊 Tools used: {result['tool_calls']}")
-            print(f"🎯 Session created: {result['session_data'] is not None}")
+            logger.info("✅ Response: %.200s...", result['response'])
+            logger.info("📊 Tools used: %s", result['tool_calls'])
+            logger.info("🎯 Session created: %s", result['session_data'] is not None)
 
             # Assertions
             assert isinstance(result, dict), "Result should be dict"
@@ -97,26 +121,22 @@ def test_chat_recommendations():
 
             # Check if weekly split tool was used
             if 'get_weekly_split_status' in result['tool_calls']:
-                print("✅ Used weekly split status (good!)")
+                logger.info("✅ Used weekly split status (good!)")
 
-            print("✅ PASS")
+            logger.info("✅ PASS")
 
         except Exception as e:
-            print(f"❌ FAIL: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ FAIL: %s", e)
             return False
 
     return True
 
 
-def test_session_creation():
+def test_session_creation(chat_agent: ChatAgent):
     """Test 3: ChatAgent should create session when user wants to start workout"""
-    print("\n" + "=" * 70)
-    print("TEST 3: Workout Session Creation")
-    print("=" * 70)
-
-    agent = ChatAgent()
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST 3: Workout Session Creation")
+    logger.info("=" * 70)
 
     test_phrases = [
         "Let's do a push workout",
@@ -125,16 +145,18 @@ def test_session_creation():
         "I'm ready to workout"
     ]
 
-    for phrase in test_phrases:
-        print(f"\n👤 User: {phrase}")
-        print("🤖 Agent thinking...\n")
+    results = _chat_all(chat_agent, test_phrases)
+
+    for phrase, result in zip(test_phrases, results):
+        logger.info("\n👤 User: %s", phrase)
 
         try:
-            result = agent.chat(phrase)
+            if isinstance(result, Exception):
+                raise result
 
-            print(f"✅ Response: {result['response'][:200]}...")
-            print(f"📊 Tools used: {result['tool_calls']}")
-            print(f"🎯 Session created: {result['session_data'] is not None}")
+            logger.info("✅ Response: %.200s...", result['response'])
+            logger.info("📊 Tools used: %s", result['tool_calls'])
+            logger.info("🎯 Session created: %s", result['session_data'] is not None)
 
             # Assertions
             assert isinstance(result, dict), "Result should be dict"
@@ -142,22 +164,17 @@ def test_session_creation():
             assert 'start_workout_session' in result['tool_calls'], f"Should call start_workout_session, called: {result['tool_calls']}"
             assert result['session_data'] is not None, "Should create session data"
 
-            # Validate session structure
-            session = result['session_data']
-            assert 'session_id' in session, "Session should have ID"
-            assert 'suggested_type' in session, "Session should have workout type"
-            assert 'planned_template' in session, "Session should have template"
+            # Validate session structure (raises ValidationError naming missing fields)
+            session = SessionData.model_validate(result['session_data'])
 
-            print(f"🏋️  Session ID: {session['session_id']}")
-            print(f"💪 Workout Type: {session['suggested_type']}")
-            print(f"📋 Exercises: {len(session['planned_template'].get('exercises', []))}")
+            logger.info("🏋️  Session ID: %s", session.session_id)
+            logger.info("💪 Workout Type: %s", session.suggested_type)
+            logger.info("📋 Exercises: %s", len(session.planned_template.get('exercises', [])))
 
-            print("✅ PASS")
+            logger.info("✅ PASS")
 
         except Exception as e:
-            print(f"❌ FAIL: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ FAIL: %s", e)
             return False
 
     return True
@@ -165,46 +182,42 @@ def test_session_creation():
 
 def test_orchestrator_integration():
     """Test 4: Orchestrator should route to ChatAgent and pass session_data"""
-    print("\n" + "=" * 70)
-    print("TEST 4: Orchestrator Integration")
-    print("=" * 70)
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST 4: Orchestrator Integration")
+    logger.info("=" * 70)
 
     orchestrator = GymBroOrchestrator()
 
     # Test chat intent routing
-    print("\n👤 User: Let's start a workout")
-    print("🤖 Orchestrator routing...\n")
+    logger.info("\n👤 User: Let's start a workout")
+    logger.info("🤖 Orchestrator routing...\n")
 
     try:
         result = orchestrator.process_message("Let's start a workout")
 
-        print(f"🎯 Intent: {result['intent']}")
-        print(f"🔧 Handler: {result['handler']}")
-        print(f"✅ Response: {result['response'][:200]}...")
-        print(f"🎯 Session data present: {result['session_data'] is not None}")
+        logger.info("🎯 Intent: %s", result['intent'])
+        logger.info("🔧 Handler: %s", result['handler'])
+        logger.info("✅ Response: %.200s...", result['response'])
+        logger.info("🎯 Session data present: %s", result['session_data'] is not None)
 
         # Assertions
         assert result['intent'] == 'chat', f"Should route to chat, got: {result['intent']}"
         assert result['handler'] == 'chat_agent', f"Should use chat_agent, got: {result['handler']}"
         assert result['session_data'] is not None, "Should have session data"
 
-        print("✅ PASS")
+        logger.info("✅ PASS")
         return True
 
     except Exception as e:
-        print(f"❌ FAIL: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ FAIL: %s", e)
         return False
 
 
-def test_no_false_sessions():
+def test_no_false_sessions(chat_agent: ChatAgent):
     """Test 5: ChatAgent should NOT create sessions for casual conversation"""
-    print("\n" + "=" * 70)
-    print("TEST 5: No False Session Creation")
-    print("=" * 70)
-
-    agent = ChatAgent()
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST 5: No False Session Creation")
+    logger.info("=" * 70)
 
     casual_messages = [
         "Hey, how are you?",
@@ -213,32 +226,32 @@ def test_no_false_sessions():
         "I'm feeling tired today"
     ]
 
-    for message in casual_messages:
-        print(f"\n👤 User: {message}")
-        print("🤖 Agent thinking...\n")
+    results = _chat_all(chat_agent, casual_messages)
+
+    for message, result in zip(casual_messages, results):
+        logger.info("\n👤 User: %s", message)
 
         try:
-            result = agent.chat(message)
+            if isinstance(result, Exception):
+                raise result
 
-            print(f"✅ Response: {result['response'][:150]}...")
-            print(f"📊 Tools used: {result['tool_calls']}")
-            print(f"🎯 Session created: {result['session_data'] is not None}")
+            logger.info("✅ Response: %.150s...", result['response'])
+            logger.info("📊 Tools used: %s", result['tool_calls'])
+            logger.info("🎯 Session created: %s", result['session_data'] is not None)
 
             # Assertions
             assert result['session_data'] is None, f"Casual message shouldn't create session: '{message}'"
 
-            print("✅ PASS - No false session")
+            logger.info("✅ PASS - No false session")
 
         except Exception as e:
-            print(f"❌ FAIL: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ FAIL: %s", e)
             return False
 
     return True
 
 
-def main():
+async def main():
     """Run all tests"""
     print("\n" + "=" * 70)
     print("🏋️  CHAT-WORKOUT INTEGRATION TEST SUITE")
@@ -249,36 +262,48 @@ def main():
     print("  ✓ Orchestrator integration")
     print("  ✓ Session data extraction\n")
 
-    results = []
+    # Show the tests' progress logs, grouped per test like their prints
+    handler = StdoutLogHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
 
-    # Run tests
-    results.append(("Chat History Queries", test_chat_history_query()))
-    results.append(("Chat Recommendations", test_chat_recommendations()))
-    results.append(("Session Creation", test_session_creation()))
-    results.append(("Orchestrator Integration", test_orchestrator_integration()))
-    results.append(("No False Sessions", test_no_false_sessions()))
+    # One agent for every test, as the chat_agent fixture does under pytest
+    chat_agent = ChatAgent()
+
+    # Run tests (independent, so concurrently; output is printed per test)
+    results = await run_concurrently([
+        ("Chat History Queries", partial(test_chat_history_query, chat_agent)),
+        ("Chat Recommendations", partial(test_chat_recommendations, chat_agent)),
+        ("Session Creation", partial(test_session_creation, chat_agent)),
+        ("Orchestrator Integration", test_orchestrator_integration),
+        ("No False Sessions", partial(test_no_false_sessions, chat_agent)),
+    ])
 
     # Summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
+    out = ["\n" + "=" * 70, "TEST SUMMARY", "=" * 70]
 
     for test_name, passed in results:
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status} - {test_name}")
+        out.append(f"{status} - {test_name}")
 
     total_passed = sum(1 for _, passed in results if passed)
     total_tests = len(results)
 
-    print(f"\n{total_passed}/{total_tests} tests passed")
+    out.append(f"\n{total_passed}/{total_tests} tests passed")
 
     if total_passed == total_tests:
-        print("\n🎉 ALL TESTS PASSED! Chat-workout integration is working!")
-        return 0
+        out.append("\n🎉 ALL TESTS PASSED! Chat-workout integration is working!")
     else:
-        print("\n⚠️  Some tests failed. Review errors above.")
-        return 1
+        out.append("\n⚠️  Some tests failed. Review errors above.")
+
+    print("\n".join(out))
+    return 0 if total_passed == total_tests else 1
 
 
 if __name__ == "__main__":
-    exit(main())
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    exit(asyncio.run(main()))
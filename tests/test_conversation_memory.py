@@ -3,22 +3,39 @@ Test conversation memory and context retention.
 
 This test simulates the exact scenario the user reported where the agent
 lost track of equipment constraints and didn't trigger session creation.
+
+Progress is logged at INFO with %-style arguments, so response previews are
+only sliced and formatted when a record is actually emitted (running the
+file directly, or pytest with --log-level=INFO).
 """
 
-import sys
-import os
-from dotenv import load_dotenv
+import asyncio
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 
-# Add project root to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from pydantic import ValidationError
 
 from src.agents.chat_agent import ChatAgent
 from src.agents.main import GymBroOrchestrator
+from _parallel import StdoutLogHandler, run_concurrently
+from _session import SessionData
+
+logger = logging.getLogger(__name__)
+
 
-load_dotenv()
+def _speculative_next_turn(pool: ThreadPoolExecutor, orchestrator: GymBroOrchestrator, next_msg: str) -> Future:
+    """
+    Start classifying a scripted follow-up while the current turn runs.
+
+    Intent classification only looks at the message text, so the result is
+    valid whatever the current turn answers; pass it to process_message()
+    as intent= to skip the classification round trip.
+    """
+    return pool.submit(orchestrator.classify_intent, next_msg)
 
 
-def test_equipment_constraint_memory():
+def test_equipment_constraint_memory(chat_agent: ChatAgent):
     """
     Test that agent remembers equipment constraints across conversation turns.
 
@@ -28,40 +45,39 @@ def test_equipment_constraint_memory():
     3. User says "tell me more about what we'll do for legs"
     4. Agent should CREATE session with equipment constraints remembered
     """
-    print("\n" + "=" * 70)
-    print("TEST: Equipment Constraint Memory")
-    print("=" * 70)
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST: Equipment Constraint Memory")
+    logger.info("=" * 70)
 
-    agent = ChatAgent()
     conversation_history = []
 
     # Turn 1: User mentions equipment constraints
-    print("\n👤 User: I'm at home, need a quick workout for the next two days, only have dumbbells, keep it simple")
+    logger.info("\n👤 User: I'm at home, need a quick workout for the next two days, only have dumbbells, keep it simple")
 
-    result1 = agent.chat(
+    result1 = chat_agent.chat(
         "I'm at home, need a quick workout for the next two days, only have dumbbells, keep it simple",
         chat_history=conversation_history
     )
 
-    print(f"🤖 Agent: {result1['response'][:200]}...")
-    print(f"📊 Tools: {result1['tool_calls']}")
-    print(f"🎯 Session: {result1['session_data'] is not None}")
+    logger.info("🤖 Agent: %.200s...", result1['response'])
+    logger.info("📊 Tools: %s", result1['tool_calls'])
+    logger.info("🎯 Session: %s", result1['session_data'] is not None)
 
     # Add to history
     conversation_history.append({"role": "user", "content": "I'm at home, need a quick workout for the next two days, only have dumbbells, keep it simple"})
     conversation_history.append({"role": "assistant", "content": result1['response']})
 
     # Turn 2: User asks for details (should trigger session with constraints)
-    print("\n👤 User: okay tell me more in detail what we will do for legs")
+    logger.info("\n👤 User: okay tell me more in detail what we will do for legs")
 
-    result2 = agent.chat(
+    result2 = chat_agent.chat(
         "okay tell me more in detail what we will do for legs",
         chat_history=conversation_history
     )
 
-    print(f"🤖 Agent: {result2['response'][:300]}...")
-    print(f"📊 Tools: {result2['tool_calls']}")
-    print(f"🎯 Session created: {result2['session_data'] is not None}")
+    logger.info("🤖 Agent: %.300s...", result2['response'])
+    logger.info("📊 Tools: %s", result2['tool_calls'])
+    logger.info("🎯 Session created: %s", result2['session_data'] is not None)
 
     # Assertions
     try:
@@ -71,29 +87,28 @@ def test_equipment_constraint_memory():
         assert result2['session_data'] is not None, \
             "Session should be created when user asks for workout details"
 
-        session = result2['session_data']
+        session = SessionData.model_validate(result2['session_data'])
 
         # Check that equipment constraints were applied
-        if 'equipment_unavailable' in session:
-            print(f"✅ Equipment constraints remembered: {session['equipment_unavailable']}")
+        if session.equipment_unavailable is not None:
+            logger.info("✅ Equipment constraints remembered: %s", session.equipment_unavailable)
 
         # Check workout type
-        workout_type = session.get('suggested_type', 'Unknown')
-        print(f"💪 Workout type: {workout_type}")
+        logger.info("💪 Workout type: %s", session.suggested_type)
 
         # Check exercises don't require unavailable equipment
-        template = session.get('planned_template', {})
-        exercises = template.get('exercises', [])
-        print(f"📋 {len(exercises)} exercises in plan")
+        exercises = session.planned_template.get('exercises', [])
+        logger.info("📋 %s exercises in plan", len(exercises))
 
-        for ex in exercises[:3]:
-            print(f"   - {ex.get('name', 'Unknown')}")
+        if logger.isEnabledFor(logging.INFO):
+            for ex in exercises[:3]:
+                logger.info("   - %s", ex.get('name', 'Unknown'))
 
-        print("\n✅ TEST PASSED: Agent remembered context and created appropriate session!")
+        logger.info("\n✅ TEST PASSED: Agent remembered context and created appropriate session!")
         return True
 
-    except AssertionError as e:
-        print(f"\n❌ TEST FAILED: {e}")
+    except (AssertionError, ValidationError) as e:
+        logger.info("\n❌ TEST FAILED: %s", e)
         return False
 
 
@@ -101,63 +116,66 @@ def test_multi_turn_context():
     """
     Test that orchestrator maintains context across multiple turns.
     """
-    print("\n" + "=" * 70)
-    print("TEST: Multi-Turn Context via Orchestrator")
-    print("=" * 70)
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST: Multi-Turn Context via Orchestrator")
+    logger.info("=" * 70)
 
     orchestrator = GymBroOrchestrator()
     conversation_history = []
 
     # Turn 1: Initial request with constraints
-    print("\n👤 User: I'm stressed, need simple workout, only dumbbells")
+    logger.info("\n👤 User: I'm stressed, need simple workout, only dumbbells")
 
-    result1 = orchestrator.process_message(
-        "I'm stressed, need simple workout, only dumbbells",
-        chat_history=conversation_history
-    )
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Turn 2 is scripted, so its intent can be worked out during turn 1
+        next_intent = _speculative_next_turn(pool, orchestrator, "show me what we'll do")
+
+        result1 = orchestrator.process_message(
+            "I'm stressed, need simple workout, only dumbbells",
+            chat_history=conversation_history
+        )
 
-    print(f"🎯 Intent: {result1['intent']}")
-    print(f"🔧 Handler: {result1['handler']}")
-    print(f"🤖 Response: {result1['response'][:150]}...")
+    logger.info("🎯 Intent: %s", result1['intent'])
+    logger.info("🔧 Handler: %s", result1['handler'])
+    logger.info("🤖 Response: %.150s...", result1['response'])
 
     # Add to history
     conversation_history.append({"role": "user", "content": "I'm stressed, need simple workout, only dumbbells"})
     conversation_history.append({"role": "assistant", "content": result1['response']})
 
     # Turn 2: Follow-up asking for specifics
-    print("\n👤 User: show me what we'll do")
+    logger.info("\n👤 User: show me what we'll do")
 
     result2 = orchestrator.process_message(
         "show me what we'll do",
-        chat_history=conversation_history
+        chat_history=conversation_history,
+        intent=next_intent.result()
     )
 
-    print(f"🎯 Intent: {result2['intent']}")
-    print(f"🔧 Handler: {result2['handler']}")
-    print(f"🤖 Response: {result2['response'][:150]}...")
-    print(f"🎯 Session created: {result2['session_data'] is not None}")
+    logger.info("🎯 Intent: %s", result2['intent'])
+    logger.info("🔧 Handler: %s", result2['handler'])
+    logger.info("🤖 Response: %.150s...", result2['response'])
+    logger.info("🎯 Session created: %s", result2['session_data'] is not None)
 
     try:
         assert result2['session_data'] is not None, \
             "Follow-up 'show me what we'll do' should create session"
 
-        print("\n✅ TEST PASSED: Context maintained across orchestrator calls!")
+        logger.info("\n✅ TEST PASSED: Context maintained across orchestrator calls!")
         return True
 
     except AssertionError as e:
-        print(f"\n❌ TEST FAILED: {e}")
+        logger.info("\n❌ TEST FAILED: %s", e)
         return False
 
 
-def test_tell_me_more_trigger():
+def test_tell_me_more_trigger(chat_agent: ChatAgent):
     """
     Test that 'tell me more' phrases trigger session creation.
     """
-    print("\n" + "=" * 70)
-    print("TEST: 'Tell Me More' Trigger Phrase")
-    print("=" * 70)
-
-    agent = ChatAgent()
+    logger.info("\n" + "=" * 70)
+    logger.info("TEST: 'Tell Me More' Trigger Phrase")
+    logger.info("=" * 70)
 
     trigger_phrases = [
         "tell me more in detail what we will do for legs",
@@ -168,62 +186,74 @@ def test_tell_me_more_trigger():
 
     all_passed = True
 
-    for phrase in trigger_phrases:
-        print(f"\n👤 User: {phrase}")
+    results = chat_agent.chat_batch(trigger_phrases)
 
-        result = agent.chat(phrase)
+    for phrase, result in zip(trigger_phrases, results):
+        logger.info("\n👤 User: %s", phrase)
 
-        print(f"📊 Tools: {result['tool_calls']}")
-        print(f"🎯 Session: {result['session_data'] is not None}")
+        logger.info("📊 Tools: %s", result['tool_calls'])
+        logger.info("🎯 Session: %s", result['session_data'] is not None)
 
         if 'start_workout_session' not in result['tool_calls']:
-            print(f"⚠️  WARNING: Phrase didn't trigger session: '{phrase}'")
+            logger.info("⚠️  WARNING: Phrase didn't trigger session: '%s'", phrase)
             all_passed = False
         else:
-            print(f"✅ Correctly triggered session")
+            logger.info("✅ Correctly triggered session")
 
     return all_passed
 
 
-def main():
+async def main():
     """Run all conversation memory tests"""
     print("\n" + "=" * 70)
     print("🧠 CONVERSATION MEMORY TEST SUITE")
     print("=" * 70)
     print("\nTesting fixes for context loss bug...")
 
-    results = []
+    # Show the tests' progress logs, grouped per test like their prints
+    handler = StdoutLogHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
 
-    # Run tests
-    results.append(("Equipment Constraint Memory", test_equipment_constraint_memory()))
-    results.append(("Multi-Turn Context", test_multi_turn_context()))
-    results.append(("'Tell Me More' Triggers", test_tell_me_more_trigger()))
+    # One agent for every test, as the chat_agent fixture does under pytest
+    chat_agent = ChatAgent()
+
+    # Run tests (independent, so concurrently; output is printed per test)
+    results = await run_concurrently([
+        ("Equipment Constraint Memory", partial(test_equipment_constraint_memory, chat_agent)),
+        ("Multi-Turn Context", test_multi_turn_context),
+        ("'Tell Me More' Triggers", partial(test_tell_me_more_trigger, chat_agent)),
+    ])
 
     # Summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
+    out = ["\n" + "=" * 70, "TEST SUMMARY", "=" * 70]
 
     for test_name, passed in results:
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status} - {test_name}")
+        out.append(f"{status} - {test_name}")
 
     total_passed = sum(1 for _, passed in results if passed)
     total = len(results)
 
-    print(f"\n{total_passed}/{total} tests passed")
+    out.append(f"\n{total_passed}/{total} tests passed")
 
     if total_passed == total:
-        print("\n🎉 All context retention tests passed!")
-        print("\nThe conversation memory bug is FIXED:")
-        print("✅ Equipment constraints are remembered")
-        print("✅ Context flows through orchestrator")
-        print("✅ 'Tell me more' triggers session creation")
-        return 0
+        out.append("\n🎉 All context retention tests passed!")
+        out.append("\nThe conversation memory bug is FIXED:")
+        out.append("✅ Equipment constraints are remembered")
+        out.append("✅ Context flows through orchestrator")
+        out.append("✅ 'Tell me more' triggers session creation")
     else:
-        print("\n⚠️  Some tests failed. Review above.")
-        return 1
+        out.append("\n⚠️  Some tests failed. Review above.")
+
+    print("\n".join(out))
+    return 0 if total_passed == total else 1
 
 
 if __name__ == "__main__":
-    exit(main())
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    exit(asyncio.run(main()))
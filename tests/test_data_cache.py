@@ -0,0 +1,89 @@
+"""
+Tests for the data layer read cache.
+
+Uses a fake Supabase client, so no credentials or network are needed.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import data
+
+
+LOGS = [
+    {"id": "2025-12-24-001", "date": "2025-12-24", "type": "Pull", "exercises": []},
+    {"id": "2025-12-22-001", "date": "2025-12-22", "type": "Push", "exercises": []},
+    {"id": "2025-11-30-001", "date": "2025-11-30", "type": "Legs", "exercises": []},
+]
+
+
+@pytest.fixture
+def fake_client():
+    """Patch the Supabase client; every query chain returns LOGS."""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value.order.return_value
+    query.eq.return_value = query
+    query.execute.return_value = MagicMock(data=[dict(log) for log in LOGS])
+
+    data.clear_data_cache()
+    with patch.object(data, "get_supabase_client", return_value=client):
+        yield client
+    data.clear_data_cache()
+
+
+def test_repeated_reads_hit_database_once(fake_client):
+    """get_all_logs and date-range reads share one query."""
+    data.get_all_logs()
+    data.get_all_logs()
+    data.get_logs_by_date_range(date(2025, 12, 1), date(2025, 12, 31))
+
+    assert fake_client.table.call_count == 1
+
+
+def test_date_range_filters_cached_logs(fake_client):
+    """Date range is inclusive on both ends and keeps newest-first order."""
+    logs = data.get_logs_by_date_range(date(2025, 12, 22), date(2025, 12, 24))
+
+    assert [log["id"] for log in logs] == ["2025-12-24-001", "2025-12-22-001"]
+
+
+@pytest.mark.parametrize("start,end,expected", [
+    (date(2025, 12, 23), date(2025, 12, 31), ["2025-12-24-001"]),
+    (date(2025, 11, 1), date(2025, 11, 30), ["2025-11-30-001"]),
+    (date(2026, 1, 1), date(2026, 1, 31), []),
+    (date(2025, 12, 24), date(2025, 12, 22), []),
+])
+def test_date_range_edges(fake_client, start, end, expected):
+    """Ranges at, between and outside the logged dates."""
+    logs = data.get_logs_by_date_range(start, end)
+
+    assert [log["id"] for log in logs] == expected
+
+
+def test_write_invalidates_cache(fake_client):
+    """A write forces the next read back to the database."""
+    data.get_all_logs()
+    data.delete_log("2025-12-24-001")
+    data.get_all_logs()
+
+    # read, delete, read
+    assert fake_client.table.call_count == 3
+
+
+def test_callers_cannot_mutate_cache(fake_client):
+    """Sorting or clearing a returned list leaves the cached copy intact."""
+    data.get_all_logs().clear()
+
+    assert len(data.get_all_logs()) == len(LOGS)
+
+
+def test_callers_cannot_mutate_cached_logs(fake_client):
+    """Editing a returned log, from either read, leaves the cached log intact."""
+    data.get_all_logs()[0]["type"] = "Legs"
+    data.get_logs_by_date_range(date(2025, 12, 24), date(2025, 12, 24))[0]["exercises"].append({})
+
+    log = data.get_all_logs()[0]
+    assert log["type"] == "Pull"
+    assert log["exercises"] == []
@@ -3,13 +3,30 @@ Comprehensive Intent Router Tests
 
 Tests the router's ability to classify various user inputs correctly,
 including edge cases, ambiguous messages, and mixed intents.
+
+Classifications go through the on-disk LLM cache (tests/_llm_cache.py), both
+under pytest and when run directly, so unchanged prompts are not re-sent.
+Set PYTEST_LLM_CACHE=off for fresh classifications.
 """
 
-import os
-from dotenv import load_dotenv
+import asyncio
 from src.agents.router import IntentRouter, quick_route
+from _parallel import call_coalesced
+
+# Max classification calls in flight at once
+CLASSIFY_CONCURRENCY = 8
+
+
+async def _classify_all(router: IntentRouter, inputs: list[str]) -> list:
+    """Classify inputs concurrently; results (or exceptions) in input order."""
+    semaphore = asyncio.Semaphore(CLASSIFY_CONCURRENCY)
+
+    async def classify_one(user_input):
+        async with semaphore:
+            return await asyncio.to_thread(call_coalesced, router.classify, user_input)
+
+    return await asyncio.gather(*(classify_one(i) for i in inputs), return_exceptions=True)
 
-load_dotenv()
 
 def test_intent_router():
     """Test intent classification with diverse inputs."""
@@ -66,26 +83,32 @@ def test_intent_router():
 
     print(f"\nTesting {len(test_cases)} different inputs...\n")
 
+    # Quick patterns are instant; only the misses need the LLM classifier.
+    # Those calls are independent, so send them concurrently.
+    quick_results = [quick_route(user_input) for user_input, _ in test_cases]
+    slow_inputs = [
+        user_input for (user_input, _), quick in zip(test_cases, quick_results) if not quick
+    ]
+    slow_results = iter(asyncio.run(_classify_all(router, slow_inputs)))
+
     correct = 0
     incorrect = 0
     results = []
+    out = []
 
-    for i, (user_input, expected) in enumerate(test_cases, 1):
-        # Try quick route first
-        quick = quick_route(user_input)
-
-        # If quick route doesn't match, use full classification
+    for i, ((user_input, expected), quick) in enumerate(zip(test_cases, quick_results), 1):
+        # Quick route hit, or the full classification gathered above
         if quick:
             classified = quick
             method = "quick"
         else:
-            try:
-                result = router.classify(user_input)
+            result = next(slow_results)
+            if isinstance(result, Exception):
+                classified = "error"
+                method = f"error: {result}"
+            else:
                 classified = result.intent
                 method = "llm"
-            except Exception as e:
-                classified = "error"
-                method = f"error: {e}"
 
         is_correct = classified == expected
         if is_correct:
@@ -103,25 +126,32 @@ def test_intent_router():
             "correct": is_correct
         })
 
-        print(f"{status} {i:2d}. '{user_input[:40]:<40}' → {classified:10} ({method})")
+        out.append(f"{status} {i:2d}. '{user_input[:40]:<40}' → {classified:10} ({method})")
 
     # Summary
-    print("\n" + "=" * 80)
-    print("SUMMARY")
-    print("=" * 80)
-    print(f"Total tests: {len(test_cases)}")
-    print(f"Correct: {correct} ({correct/len(test_cases)*100:.1f}%)")
-    print(f"Incorrect: {incorrect} ({incorrect/len(test_cases)*100:.1f}%)")
+    out.append("\n" + "=" * 80)
+    out.append("SUMMARY")
+    out.append("=" * 80)
+    out.append(f"Total tests: {len(test_cases)}")
+    out.append(f"Correct: {correct} ({correct/len(test_cases)*100:.1f}%)")
+    out.append(f"Incorrect: {incorrect} ({incorrect/len(test_cases)*100:.1f}%)")
 
     # Show incorrect classifications
     if incorrect > 0:
-        print("\n❌ MISCLASSIFICATIONS:")
+        out.append("\n❌ MISCLASSIFICATIONS:")
         for r in results:
             if not r["correct"]:
-                print(f"  '{r['input']}' → Expected: {r['expected']}, Got: {r['classified']}")
+                out.append(f"  '{r['input']}' → Expected: {r['expected']}, Got: {r['classified']}")
+
+    print("\n".join(out))
 
     return results
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+    from _llm_cache import install_llm_cache
+
+    load_dotenv()
+    install_llm_cache()
     results = test_intent_router()
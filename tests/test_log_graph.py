@@ -3,13 +3,40 @@ Comprehensive Log Graph Tests
 
 Tests the LangGraph workflow with various workout input formats,
 including edge cases, incomplete data, and different notation styles.
+
+Inputs with no set/rep/weight numbers and fewer than four words (e.g. "gym")
+are answered locally instead of being sent through the LLM parse.
 """
 
 import os
-from dotenv import load_dotenv
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 from src.agents.log_graph import start_workout_log
 
-load_dotenv()
+
+# Any "135x8", "8 reps", "3 sets", "60kg"-style token
+_HAS_SETS = re.compile(r"\d+\s*[x×]\s*\d+|\d+\s*(?:reps?|sets?|lbs?|kg)", re.IGNORECASE)
+
+
+def _too_vague(workout: str) -> bool:
+    """True for short inputs with nothing to log (e.g. "gym", "shoulders")."""
+    return len(workout.split()) < 4 and not _HAS_SETS.search(workout)
+
+
+def _parse(workout: str):
+    """Run the log graph on one input; return its state, or the exception raised."""
+    if _too_vague(workout):
+        return {
+            "raw_notes": workout,
+            "parsed_workout": None,
+            "response": "Skipped LLM parse: no sets, reps or weights to log",
+        }
+    try:
+        return start_workout_log(workout)
+    except Exception as e:
+        return e
+
 
 def test_log_graph():
     """Test log graph with various workout formats."""
@@ -63,27 +90,34 @@ def test_log_graph():
 
     print(f"\nTesting {len(test_workouts)} different workout formats...\n")
 
+    # Each parse is an independent LLM call; run them side by side
+    max_workers = int(os.getenv("GYMBRO_PARSE_CONCURRENCY", "6"))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        states = list(pool.map(_parse, test_workouts))
+
+    out = []
     results = []
-    for i, workout in enumerate(test_workouts, 1):
-        print(f"\n{'='*80}")
-        print(f"TEST {i}/{len(test_workouts)}")
-        print("-" * 80)
-        print(f"INPUT: {workout}")
-        print("-" * 80)
+    for i, (workout, state) in enumerate(zip(test_workouts, states), 1):
+        out.append(f"\n{'='*80}")
+        out.append(f"TEST {i}/{len(test_workouts)}")
+        out.append("-" * 80)
+        out.append(f"INPUT: {workout}")
+        out.append("-" * 80)
 
         try:
-            state = start_workout_log(workout)
+            if isinstance(state, Exception):
+                raise state
 
             if state.get("parsed_workout"):
                 parsed = state["parsed_workout"]
-                print(f"✅ PARSED SUCCESSFULLY")
-                print(f"   Date: {parsed.get('date')}")
-                print(f"   Type: {parsed.get('type')}")
-                print(f"   Exercises: {len(parsed.get('exercises', []))}")
+                out.append(f"✅ PARSED SUCCESSFULLY")
+                out.append(f"   Date: {parsed.get('date')}")
+                out.append(f"   Type: {parsed.get('type')}")
+                out.append(f"   Exercises: {len(parsed.get('exercises', []))}")
 
                 for ex in parsed.get('exercises', []):
                     sets_count = len(ex.get('sets', []))
-                    print(f"     • {ex.get('name')}: {sets_count} sets")
+                    out.append(f"     • {ex.get('name')}: {sets_count} sets")
 
                 results.append({
                     "input": workout,
@@ -92,8 +126,8 @@ def test_log_graph():
                     "type": parsed.get('type')
                 })
             else:
-                print(f"❌ PARSE FAILED")
-                print(f"   Response: {state.get('response', 'No response')[:100]}")
+                out.append(f"❌ PARSE FAILED")
+                out.append(f"   Response: {state.get('response', 'No response')[:100]}")
                 results.append({
                     "input": workout,
                     "success": False,
@@ -101,7 +135,7 @@ def test_log_graph():
                 })
 
         except Exception as e:
-            print(f"❌ ERROR: {str(e)[:100]}")
+            out.append(f"❌ ERROR: {str(e)[:100]}")
             results.append({
                 "input": workout,
                 "success": False,
@@ -110,26 +144,26 @@ def test_log_graph():
 
     # Summary
     successful = sum(1 for r in results if r["success"])
-    print(f"\n\n{'='*80}")
-    print("LOG GRAPH SUMMARY")
-    print("=" * 80)
-    print(f"Total tests: {len(test_workouts)}")
-    print(f"Successful parses: {successful}/{len(test_workouts)} ({successful/len(test_workouts)*100:.1f}%)")
-    print(f"Failed: {len(test_workouts) - successful}")
+    out.append(f"\n\n{'='*80}")
+    out.append("LOG GRAPH SUMMARY")
+    out.append("=" * 80)
+    out.append(f"Total tests: {len(test_workouts)}")
+    out.append(f"Successful parses: {successful}/{len(test_workouts)} ({successful/len(test_workouts)*100:.1f}%)")
+    out.append(f"Failed: {len(test_workouts) - successful}")
 
     # Show failures
     failures = [r for r in results if not r["success"]]
     if failures:
-        print(f"\n❌ FAILED TESTS:")
+        out.append(f"\n❌ FAILED TESTS:")
         for f in failures:
-            print(f"   '{f['input'][:50]}...' → {f.get('error', 'Unknown error')}")
+            out.append(f"   '{f['input'][:50]}...' → {f.get('error', 'Unknown error')}")
 
     # Stats on successful parses
     if successful > 0:
         total_exercises = sum(r.get('exercises', 0) for r in results if r["success"])
         avg_exercises = total_exercises / successful
-        print(f"\n📊 STATISTICS:")
-        print(f"   Average exercises per workout: {avg_exercises:.1f}")
+        out.append(f"\n📊 STATISTICS:")
+        out.append(f"   Average exercises per workout: {avg_exercises:.1f}")
 
         types = {}
         for r in results:
@@ -137,12 +171,18 @@ def test_log_graph():
                 workout_type = r.get('type', 'Unknown')
                 types[workout_type] = types.get(workout_type, 0) + 1
 
-        print(f"   Workout types detected:")
+        out.append(f"   Workout types detected:")
         for t, count in types.items():
-            print(f"     {t}: {count}")
+            out.append(f"     {t}: {count}")
+
+    print("\n".join(out))
 
     return results
 
 
 if __name__ == "__main__":
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     results = test_log_graph()
@@ -2,181 +2,233 @@
 Quick validation script for UI integration code.
 
 Checks that all the pieces are in place for chat-workout navigation flow.
+
+With --cache PATH (e.g. .validate_cache.json), results are saved per file
+and reused on the next run for files whose size and mtime are unchanged,
+as long as their checks are unchanged too.
 """
 
+import argparse
+import asyncio
+import hashlib
+import json
 import sys
 import os
+import re
+from functools import lru_cache
+from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-def validate_chat_page():
-    """Validate pages/2_Chat.py has navigation button code"""
-    print("\n📄 Validating pages/2_Chat.py...")
+from _parallel import run_concurrently
 
-    with open('pages/2_Chat.py', 'r') as f:
-        content = f.read()
 
-    checks = [
-        ("process_message usage", "process_message(" in content),
-        ("session_data extraction", "session_data = result.get(\"session_data\")" in content),
-        ("session storage", "st.session_state.workout_session = session_data" in content),
-        ("chat_initiated_workout flag", "st.session_state.chat_initiated_workout = True" in content),
-        ("navigation button section", "if st.session_state.get('workout_session') and st.session_state.get('chat_initiated_workout')" in content),
-        ("Continue to Workout button", "Continue to Workout" in content),
-        ("switch_page call", "st.switch_page" in content),
-        ("Cancel workout option", "Cancel Workout" in content),
-    ]
+# path → {"key": [...], "passed": bool, "report": [...]}; None when --cache is off
+_results_cache: dict | None = None
 
-    all_pass = True
-    for check_name, condition in checks:
-        status = "✅" if condition else "❌"
-        print(f"  {status} {check_name}")
-        if not condition:
-            all_pass = False
 
-    return all_pass
+@lru_cache(maxsize=None)
+def _read(path: str) -> bytes:
+    """Raw file bytes, read once per run however many validators inspect it."""
+    return Path(path).read_bytes()
 
 
-def validate_orchestrator():
-    """Validate orchestrator returns session_data"""
-    print("\n📄 Validating src/agents/main.py...")
+def _scan(content: bytes, needles: list[str]) -> set[str]:
+    """
+    Return which needles occur in content, in one regex pass.
 
-    with open('src/agents/main.py', 'r') as f:
-        content = f.read()
+    Needles are matched as UTF-8 bytes, so the file is never decoded. The
+    lookahead reports a match at every position, longest needle first.
+    A needle that starts where a longer one matched is hidden by it, so
+    anything contained in a found needle counts as found too.
+    """
+    ordered = sorted({needle.encode("utf-8") for needle in needles}, key=len, reverse=True)
+    pattern = re.compile(b"(?=(" + b"|".join(map(re.escape, ordered)) + b"))")
+    found = set(pattern.findall(content))
+    return {needle.decode("utf-8") for needle in ordered if any(needle in f for f in found)}
 
-    checks = [
-        ("ChatAgent import", "from src.agents.chat_agent import ChatAgent" in content),
-        ("ChatAgent initialization", "self.chat_agent = ChatAgent()" in content),
-        ("session_data in return type", "tuple[str, str, Any]" in content or "-> tuple" in content),
-        ("chat_agent routing", "self.chat_agent.chat(user_input)" in content),
-        ("session_data extraction", "result.get(\"session_data\")" in content),
-        ("session_data in result dict", "\"session_data\": session_data" in content),
-    ]
+
+def _run_checks(path: str, checks: list[tuple]) -> bool:
+    """
+    Check path's contents and print one report block for all checks.
+
+    Each check is (name, needles) or (name, needles, present): it passes
+    when any of needles (a string or tuple of strings) occurs in the file,
+    or, with present=False, when none do.
+    """
+    stat = os.stat(path)
+    key = [stat.st_size, stat.st_mtime_ns, hashlib.blake2b(repr(checks).encode(), digest_size=16).hexdigest()]
+
+    cached = _results_cache.get(path) if _results_cache is not None else None
+    if cached and cached["key"] == key:
+        out = [cached["report"][0] + " (unchanged, cached)", *cached["report"][1:]]
+        print("\n".join(out))
+        return cached["passed"]
+
+    content = _read(path)
+
+    def needles(check):
+        return (check[1],) if isinstance(check[1], str) else check[1]
+
+    found = _scan(content, [needle for check in checks for needle in needles(check)])
 
     all_pass = True
-    for check_name, condition in checks:
+    out = [f"\n📄 Validating {path}..."]
+    for check in checks:
+        check_name = check[0]
+        present = check[2] if len(check) > 2 else True
+        condition = any(needle in found for needle in needles(check)) == present
         status = "✅" if condition else "❌"
-        print(f"  {status} {check_name}")
+        out.append(f"  {status} {check_name}")
         if not condition:
             all_pass = False
 
+    if _results_cache is not None:
+        _results_cache[path] = {"key": key, "passed": all_pass, "report": out}
+
+    print("\n".join(out))
     return all_pass
 
 
-def validate_session_tools():
-    """Validate session tool returns data instead of modifying state"""
-    print("\n📄 Validating src/tools/session_tools.py...")
+def _load_cache(path: str) -> dict:
+    """Previous run's results, or {} if there are none (or they're unreadable)."""
+    try:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
 
-    with open('src/tools/session_tools.py', 'r') as f:
-        content = f.read()
+def _save_cache(path: str, cache: dict) -> None:
+    """Write the results atomically, so an interrupted run can't leave half a file."""
+    tmp = f"{path}.tmp"
+    Path(tmp).write_text(json.dumps(cache, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp, path)
 
+
+def validate_chat_page():
+    """Validate pages/2_Chat.py has navigation button code"""
     checks = [
-        ("start_workout_session defined", "def start_workout_session" in content),
-        ("Returns dict not None", "return {" in content),
-        ("session_data in return", "\"session_data\": session_state" in content),
-        ("Success flag", "\"success\": True" in content),
-        ("Message field", "\"message\":" in content),
-        ("NO st.session_state modification", "st.session_state" not in content),
-        ("Tool decorator", "@tool" in content),
-        ("initialize_planning_session call", "initialize_planning_session()" in content),
+        ("process_message usage", "process_message("),
+        ("session_data extraction", "session_data = result.get(\"session_data\")"),
+        ("session storage", "st.session_state.workout_session = session_data"),
+        ("chat_initiated_workout flag", "st.session_state.chat_initiated_workout = True"),
+        ("navigation button section", "if st.session_state.get('workout_session') and st.session_state.get('chat_initiated_workout')"),
+        ("Continue to Workout button", "Continue to Workout"),
+        ("switch_page call", "st.switch_page"),
+        ("Cancel workout option", "Cancel Workout"),
     ]
 
-    all_pass = True
-    for check_name, condition in checks:
-        status = "✅" if condition else "❌"
-        print(f"  {status} {check_name}")
-        if not condition:
-            all_pass = False
+    return _run_checks('pages/2_Chat.py', checks)
 
-    return all_pass
 
+def validate_orchestrator():
+    """Validate orchestrator returns session_data"""
+    checks = [
+        ("ChatAgent import", "from src.agents.chat_agent import ChatAgent"),
+        ("ChatAgent initialization", "self.chat_agent = ChatAgent()"),
+        ("session_data in return type", ("tuple[str, str, Any]", "-> tuple")),
+        ("chat_agent routing", "self.chat_agent.chat(user_input)"),
+        ("session_data extraction", "result.get(\"session_data\")"),
+        ("session_data in result dict", "\"session_data\": session_data"),
+    ]
 
-def validate_chat_agent():
-    """Validate ChatAgent extracts session_data from tool results"""
-    print("\n📄 Validating src/agents/chat_agent.py...")
+    return _run_checks('src/agents/main.py', checks)
 
-    with open('src/agents/chat_agent.py', 'r') as f:
-        content = f.read()
 
+def validate_session_tools():
+    """Validate session tool returns data instead of modifying state"""
     checks = [
-        ("ChatAgent class", "class ChatAgent:" in content),
-        ("start_workout_session in tools", "start_workout_session" in content),
-        ("Returns dict with session_data", "\"session_data\": session_data" in content),
-        ("Extracts from ToolMessage", "ToolMessage" in content),
-        ("ast.literal_eval", "ast.literal_eval" in content),
-        ("Trigger phrases in prompt", "TRIGGER PHRASES" in content or "let's start" in content),
-        ("Temperature setting", "temperature=0.2" in content),
+        ("start_workout_session defined", "def start_workout_session"),
+        ("Returns dict not None", "return {"),
+        ("session_data in return", "\"session_data\": session_state"),
+        ("Success flag", "\"success\": True"),
+        ("Message field", "\"message\":"),
+        ("NO st.session_state modification", "st.session_state", False),
+        ("Tool decorator", "@tool"),
+        ("initialize_planning_session call", "initialize_planning_session()"),
     ]
 
-    all_pass = True
-    for check_name, condition in checks:
-        status = "✅" if condition else "❌"
-        print(f"  {status} {check_name}")
-        if not condition:
-            all_pass = False
+    return _run_checks('src/tools/session_tools.py', checks)
 
-    return all_pass
 
+def validate_chat_agent():
+    """Validate ChatAgent extracts session_data from tool results"""
+    checks = [
+        ("ChatAgent class", "class ChatAgent:"),
+        ("start_workout_session in tools", "start_workout_session"),
+        ("Returns dict with session_data", "\"session_data\": session_data"),
+        ("Extracts from ToolMessage", "ToolMessage"),
+        ("ast.literal_eval", "ast.literal_eval"),
+        ("Trigger phrases in prompt", ("TRIGGER PHRASES", "let's start")),
+        ("Temperature setting", "temperature=0.2"),
+    ]
 
-def validate_session_state():
-    """Validate session.py has chat_initiated_workout flag"""
-    print("\n📄 Validating src/ui/session.py...")
+    return _run_checks('src/agents/chat_agent.py', checks)
 
-    with open('src/ui/session.py', 'r') as f:
-        content = f.read()
 
+def validate_session_state():
+    """Validate session.py has chat_initiated_workout flag"""
     checks = [
-        ("chat_initiated_workout initialization", "'chat_initiated_workout'" in content),
-        ("Reset includes chat flag", "chat_initiated_workout = False" in content),
+        ("chat_initiated_workout initialization", "'chat_initiated_workout'"),
+        ("Reset includes chat flag", "chat_initiated_workout = False"),
     ]
 
-    all_pass = True
-    for check_name, condition in checks:
-        status = "✅" if condition else "❌"
-        print(f"  {status} {check_name}")
-        if not condition:
-            all_pass = False
-
-    return all_pass
+    return _run_checks('src/ui/session.py', checks)
 
 
-def main():
+def main(argv: list[str] | None = None):
     """Run all validation checks"""
+    global _results_cache
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--cache",
+        metavar="PATH",
+        help="JSON file of per-file results; unchanged files are not re-validated",
+    )
+    args = parser.parse_args(argv)
+    if args.cache:
+        _results_cache = _load_cache(args.cache)
+
     print("=" * 70)
     print("🔍 UI INTEGRATION VALIDATION")
     print("=" * 70)
     print("\nValidating that all code pieces are correctly integrated...")
 
-    results = []
-    results.append(("Chat Page", validate_chat_page()))
-    results.append(("Orchestrator", validate_orchestrator()))
-    results.append(("Session Tools", validate_session_tools()))
-    results.append(("Chat Agent", validate_chat_agent()))
-    results.append(("Session State", validate_session_state()))
+    # Independent file checks, so run them side by side; each one's output
+    # is still printed as a block, in this order
+    results = asyncio.run(run_concurrently([
+        ("Chat Page", validate_chat_page),
+        ("Orchestrator", validate_orchestrator),
+        ("Session Tools", validate_session_tools),
+        ("Chat Agent", validate_chat_agent),
+        ("Session State", validate_session_state),
+    ]))
 
-    print("\n" + "=" * 70)
-    print("VALIDATION SUMMARY")
-    print("=" * 70)
+    if args.cache:
+        _save_cache(args.cache, _results_cache)
+
+    out = ["\n" + "=" * 70, "VALIDATION SUMMARY", "=" * 70]
 
     for component, passed in results:
         status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status} - {component}")
+        out.append(f"{status} - {component}")
 
     total_passed = sum(1 for _, passed in results if passed)
     total = len(results)
 
-    print(f"\n{total_passed}/{total} components validated")
+    out.append(f"\n{total_passed}/{total} components validated")
 
     if total_passed == total:
-        print("\n✅ All UI integration code is in place!")
-        print("\nNext step: Manual testing in Streamlit UI")
-        print("See tests/MANUAL_TESTING_GUIDE.md for test steps")
-        return 0
+        out.append("\n✅ All UI integration code is in place!")
+        out.append("\nNext step: Manual testing in Streamlit UI")
+        out.append("See tests/MANUAL_TESTING_GUIDE.md for test steps")
     else:
-        print("\n⚠️  Some components have issues. Review above.")
-        return 1
+        out.append("\n⚠️  Some components have issues. Review above.")
 
+    print("\n".join(out))
+    return 0 if total_passed == total else 1
 
 if __name__ == "__main__":
     exit(main())